@@ -29,6 +29,7 @@ source.include_exts = py,kv,png,jpg,xml
 # (list) List of exclusions using pattern matching
 # Do not prefix with './'
 #source.exclude_patterns = license,images/*/*.jpg
+source.exclude_patterns = setup.py
 
 # (str) Application versioning (method 1)
 version = 1.7
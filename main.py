@@ -4,7 +4,7 @@ Main application file with yt-dlp integration
 Supports: Android, Desktop, and WSL
 
 Fixes applied:
-  - All Android imports guarded with try/except at top level
+  - Android detected via ANDROID_ARGUMENT; android/jnius imported lazily where used
   - mActivity imported correctly for ffmpeg binary resolution
   - ffmpeg binary resolved lazily via get_ffmpeg_bin() — never at module level
   - Correct API 33 permissions (READ_MEDIA_VIDEO / READ_MEDIA_AUDIO + WRITE_EXTERNAL_STORAGE)
@@ -19,47 +19,241 @@ New features:
   - Cancel button with confirmation dialog — also deletes .part files on disk
   - Resume continues from where it stopped (yt-dlp --continue flag)
   - Share intent: YouTube URL pasted from YouTube share, copied to clipboard as fallback
+  - App runs on Kivy's asyncio loop — downloads dispatched as tasks, blocking
+    yt-dlp work handed to the loop's executor instead of a fresh thread per click
+  - Several URLs (space separated) download concurrently, num_workers at a time
 """
 
 import os
+import logging
 import re
-import glob
+import platform
+import asyncio
 import threading
+import stat
+import time
 import subprocess
+import sys
+import queue
+from collections import deque
+from concurrent.futures import Future, as_completed, wait
+from functools import partial
 from pathlib import Path
-from urllib.parse import urlparse
 
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.popup import Popup
-from kivy.uix.label import Label
-from kivy.uix.button import Button
 from kivy.clock import Clock
 from kivy.properties import StringProperty, BooleanProperty, NumericProperty
 from kivy.lang import Builder
+from kivy.factory import Factory
 from kivy.core.window import Window
+from kivy.core.clipboard import Clipboard
+
+# YTDL_DEBUG=1 turns on debug-tier lines and yt-dlp's debug/warning chatter
+_VERBOSE = bool(os.environ.get("YTDL_DEBUG"))
+
+# All app output goes through this logger. It writes to stdout itself (plain
+# messages, no level prefix) rather than relying on whatever handlers
+# Kivy puts on the root logger, so nothing depends on the Kivy version.
+# Calls use %-style args, so lines below the level are never formatted.
+log = logging.getLogger("ytdl")
+log.setLevel(logging.DEBUG if _VERBOSE else logging.INFO)
+log.propagate = False
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+log.addHandler(_log_handler)
 
 # ── Platform detection ─────────────────────────────────────────────────────────
-# ALL Android imports must live inside this single try/except block.
-try:
-    from android import mActivity
-    from android.permissions import request_permissions, Permission, check_permission
-    from android.storage import primary_external_storage_path
-    from jnius import autoclass
-    ANDROID = True
-except ImportError:
-    ANDROID = False
+# p4a sets ANDROID_ARGUMENT in the app environment. The android/jnius modules
+# are imported inside the functions that use them, never at module level —
+# loading them walks the JVM class loader, and that cost belongs after the
+# first frame, not before it.
+ANDROID = 'ANDROID_ARGUMENT' in os.environ
+
+_android_classes = {}
+
+
+def _android_class(name):
+    """
+    jnius autoclass(name), resolved once per class and cached. Each autoclass
+    call does a JNI FindClass plus a reflection walk to build the wrapper, and
+    the share-intent and permission paths hit the same handful of classes.
+    """
+    cls = _android_classes.get(name)
+    if cls is None:
+        from jnius import autoclass
+        cls = _android_classes[name] = autoclass(name)
+    return cls
+
+
+def _get_intent_class():
+    """android.content.Intent, resolved through jnius once and cached."""
+    return _android_class('android.content.Intent')
+
+
+_sdk_int = None
+
+
+def _get_sdk_int():
+    """Build.VERSION.SDK_INT, read through jnius once and cached."""
+    global _sdk_int
+    if _sdk_int is None:
+        _sdk_int = _android_class('android.os.Build$VERSION').SDK_INT
+    return _sdk_int
+
+
+_android_downloads_dir = None
+
+
+def _get_android_downloads_dir():
+    """Public Downloads directory path, read through jnius once and cached."""
+    global _android_downloads_dir
+    if _android_downloads_dir is None:
+        Environment = _android_class('android.os.Environment')
+        _android_downloads_dir = Environment.getExternalStoragePublicDirectory(
+            Environment.DIRECTORY_DOWNLOADS
+        ).getAbsolutePath()
+    return _android_downloads_dir
+
+
+_is_wsl_cache = None
+
+
+def _is_wsl():
+    """
+    True when running inside WSL. The WSL kernel release string contains
+    'microsoft' (e.g. 5.15.x-microsoft-standard-WSL2); platform.uname() is
+    cached by the platform module, and the answer can't change mid-process.
+    """
+    global _is_wsl_cache
+    if _is_wsl_cache is None:
+        _is_wsl_cache = 'microsoft' in platform.uname().release.lower()
+    return _is_wsl_cache
 
 if not ANDROID:
     Window.minimum_height = 780
     Window.minimum_width = 560
 
-# ── yt-dlp ─────────────────────────────────────────────────────────────────────
-import yt_dlp
+# ── yt-dlp — lazy import ───────────────────────────────────────────────────────
+# Importing yt_dlp pulls in hundreds of extractor modules (~1 s cold start on
+# Android). Deferred to the first download so the window paints immediately.
+_yt_dlp_module = None
+
+
+def get_yt_dlp():
+    """Import yt_dlp on first call; later calls return the cached module."""
+    global _yt_dlp_module
+    if _yt_dlp_module is None:
+        import yt_dlp
+        _yt_dlp_module = yt_dlp
+    return _yt_dlp_module
+
+
+# ── URL validation ─────────────────────────────────────────────────────────────
+# Compiled once — validate_url runs on every keystroke and every share intent.
+# Same acceptance as a urlparse netloc check: a `//host` part (scheme optional)
+# whose host contains youtube.com or youtu.be — any subdomain, port or case.
+_YT_RE = re.compile(
+    r'\s*(?:[a-z][a-z\d+.-]*:)?//[^/?#]*?(?:youtube\.com|youtu\.be)',
+    re.IGNORECASE,
+)
+
+# is_playlist: case-insensitive scan of the URL as-is, no lower() copy
+_PLAYLIST_RE = re.compile(r'list=|playlist', re.IGNORECASE)
+
+# Finds the first YouTube URL inside share-intent text, which is typically
+# "Video Title https://youtu.be/xxxx" or just the URL.
+_YT_URL_RE = re.compile(r'https?://(?:www\.)?(?:youtube\.com/watch\?[^\s]+|youtu\.be/[^\s]+)')
+_YT_SHARE_PREFIXES = (
+    'https://youtu.be/', 'http://youtu.be/',
+    'https://www.youtube.com/watch?', 'http://www.youtube.com/watch?',
+    'https://youtube.com/watch?', 'http://youtube.com/watch?',
+)
+
+
+def _extract_yt_url(text):
+    """
+    Return the first YouTube URL in share text, or None.
+    Fast path: the first 'http' token — share text is the bare URL or
+    "Title <url>", so this almost always hits. The regex only runs when
+    the first link in the text is not a YouTube one.
+    """
+    i = text.find('http')
+    if i < 0:
+        return None
+    # startswith(..., i) tests the prefix in place; only a hit is sliced out
+    if text.startswith(_YT_SHARE_PREFIXES, i):
+        return text[i:].split(None, 1)[0]
+    match = _YT_URL_RE.search(text, i)
+    return match.group(0) if match else None
 
 
 # ── FFmpeg binary — lazy resolution ────────────────────────────────────────────
 _ffmpeg_bin_cache = None
+# Set once a desktop lookup has failed; the install help already says to
+# restart the app, so later downloads re-raise instead of re-sweeping.
+_ffmpeg_lookup_failed = False
+
+
+# Windows install locations relative to a drive root. The full candidate
+# paths are rendered once here, grouped by root and tagged with their
+# top-level folder (lower-cased) — see _drive_candidates.
+_WIN_FFMPEG_SUBDIRS = (
+    "ffmpeg/bin/ffmpeg.exe",
+    "ffmpeg-master-latest-win64-gpl/bin/ffmpeg.exe",
+    "Program Files/ffmpeg/bin/ffmpeg.exe",
+    "Program Files (x86)/ffmpeg/bin/ffmpeg.exe",
+    "ProgramData/chocolatey/bin/ffmpeg.exe",
+    "tools/ffmpeg/bin/ffmpeg.exe",
+)
+_WIN_FFMPEG_CANDIDATES = tuple(
+    (root, tuple((sub.split("/", 1)[0].lower(), root + sub.replace("/", "\\"))
+                 for sub in _WIN_FFMPEG_SUBDIRS))
+    for root in ("C:\\", "D:\\")
+)
+_WSL_FFMPEG_CANDIDATES = tuple(
+    (root, tuple((sub.split("/", 1)[0].lower(), root + sub)
+                 for sub in _WIN_FFMPEG_SUBDIRS))
+    for root in ("/mnt/c/", "/mnt/d/")
+)
+
+_NIX_FFMPEG_CANDIDATES = (
+    "/usr/bin/ffmpeg",
+    "/usr/local/bin/ffmpeg",
+    "/opt/homebrew/bin/ffmpeg",
+    "/usr/local/Cellar/ffmpeg/bin/ffmpeg",
+    "/snap/bin/ffmpeg",
+    "/opt/ffmpeg/bin/ffmpeg",
+    os.path.expanduser("~/.local/bin/ffmpeg"),
+    os.path.expanduser("~/bin/ffmpeg"),
+)
+
+
+def _drive_candidates(root, tagged_paths):
+    """
+    Candidate paths under a drive root whose top-level folder exists. One
+    scandir of the root stands in for a stat per candidate — under WSL each
+    of those is a round trip to the Windows filesystem — and a missing drive
+    yields nothing. Names are compared lower-cased, as Windows does.
+    """
+    try:
+        with os.scandir(root) as it:
+            top = {entry.name.lower() for entry in it}
+    except OSError:
+        return ()
+    return tuple(path for folder, path in tagged_paths if folder in top)
+
+
+def _is_executable_file(path):
+    """
+    One stat() per candidate: a regular file with an execute bit. Windows
+    has no execute bits, so any regular file passes there (as with X_OK).
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return False
+    return stat.S_ISREG(mode) and (os.name == "nt" or bool(mode & 0o111))
 
 
 def _find_ffmpeg_on_desktop():
@@ -72,23 +266,15 @@ def _find_ffmpeg_on_desktop():
     # 1. System PATH first (fastest check)
     found = shutil.which("ffmpeg") or shutil.which("ffmpeg.exe")
     if found:
-        print(f"[FFmpeg] Found on PATH: {found}")
+        log.info("[FFmpeg] Found on PATH: %s", found)
         return found
 
     candidates = []
 
-    # 2. Native Windows absolute paths
-    win_subdirs = [
-        "ffmpeg/bin/ffmpeg.exe",
-        "ffmpeg-master-latest-win64-gpl/bin/ffmpeg.exe",
-        "Program Files/ffmpeg/bin/ffmpeg.exe",
-        "Program Files (x86)/ffmpeg/bin/ffmpeg.exe",
-        "ProgramData/chocolatey/bin/ffmpeg.exe",
-        "tools/ffmpeg/bin/ffmpeg.exe",
-    ]
-    for drive in ["C:", "D:"]:
-        for sub in win_subdirs:
-            candidates.append(os.path.join(drive + os.sep, sub))
+    # 2. Native Windows absolute paths — only under folders that exist
+    if os.name == "nt":
+        for root, tagged_paths in _WIN_FFMPEG_CANDIDATES:
+            candidates.extend(_drive_candidates(root, tagged_paths))
 
     # Scoop (per-user Windows)
     userprofile = os.environ.get("USERPROFILE", "")
@@ -103,40 +289,57 @@ def _find_ffmpeg_on_desktop():
         candidates.append(os.path.join(conda_base, "Library", "bin", "ffmpeg.exe"))
 
     # 3. WSL — Windows drives mounted under /mnt/c, /mnt/d
-    for mnt_drive in ["c", "d"]:
-        base = f"/mnt/{mnt_drive}"
-        if os.path.isdir(base):
-            for sub in win_subdirs:
-                wsl_sub = sub.replace("\\", "/")
-                candidates.append(f"{base}/{wsl_sub}")
+    for root, tagged_paths in _WSL_FFMPEG_CANDIDATES:
+        candidates.extend(_drive_candidates(root, tagged_paths))
 
     # 4. Common Linux / macOS locations
-    candidates.extend([
-        "/usr/bin/ffmpeg",
-        "/usr/local/bin/ffmpeg",
-        "/opt/homebrew/bin/ffmpeg",
-        "/usr/local/Cellar/ffmpeg/bin/ffmpeg",
-        "/snap/bin/ffmpeg",
-        "/opt/ffmpeg/bin/ffmpeg",
-        os.path.expanduser("~/.local/bin/ffmpeg"),
-        os.path.expanduser("~/bin/ffmpeg"),
-    ])
-
-    # Check each candidate
+    candidates.extend(_NIX_FFMPEG_CANDIDATES)
+
+    # Check each candidate — a single stat, no `ffmpeg -version` spawn
     for path in candidates:
-        if os.path.isfile(path):
-            try:
-                result = subprocess.run([path, "-version"], capture_output=True, timeout=3)
-                if result.returncode == 0:
-                    print(f"[FFmpeg] Found at: {path}")
-                    return path
-            except Exception:
-                continue
-
-    print("[FFmpeg] Not found in any known location")
+        if _is_executable_file(path):
+            log.info("[FFmpeg] Found at: %s", path)
+            return path
+
+    log.warning("[FFmpeg] Not found in any known location")
+    return None
+
+
+# Resolved desktop path is persisted so later launches skip the search
+_FFMPEG_PATH_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "ytdl-app", "ffmpeg_path"
+)
+
+
+def _read_cached_ffmpeg_path():
+    """Return the persisted ffmpeg path if it still points at an executable."""
+    try:
+        with open(_FFMPEG_PATH_CACHE_FILE, "r") as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+    if path and _is_executable_file(path):
+        return path
     return None
 
 
+def _write_cached_ffmpeg_path(path):
+    try:
+        os.makedirs(os.path.dirname(_FFMPEG_PATH_CACHE_FILE), exist_ok=True)
+        with open(_FFMPEG_PATH_CACHE_FILE, "w") as f:
+            f.write(path)
+    except OSError as e:
+        log.warning("[FFmpeg] Could not save path cache: %s", e)
+
+
+# WSL: the Windows username found by get_windows_username, per process and
+# persisted across launches next to the ffmpeg path cache
+_windows_username_cache = None
+_WINUSER_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "ytdl-app", "winuser"
+)
+
+
 FFMPEG_INSTALL_HELP = (
     "ffmpeg not found. Please install it:\n"
     "  Windows : winget install ffmpeg   (or: choco install ffmpeg)\n"
@@ -146,39 +349,80 @@ FFMPEG_INSTALL_HELP = (
 )
 
 
+_ld_library_configured = False
+
+
+def _ensure_ld_library_path(lib_dir):
+    """
+    Prepend lib_dir to LD_LIBRARY_PATH (once per process) so libffmpegbin.so
+    finds its shared libraries. Entries are compared whole — a plain
+    substring test would also match when lib_dir is a prefix of another entry.
+    """
+    global _ld_library_configured
+    if _ld_library_configured:
+        return
+    existing = os.environ.get("LD_LIBRARY_PATH", "")
+    if lib_dir not in existing.split(":"):
+        os.environ["LD_LIBRARY_PATH"] = lib_dir + (":" + existing if existing else "")
+    _ld_library_configured = True
+    log.info("[FFmpeg] LD_LIBRARY_PATH: %s", os.environ['LD_LIBRARY_PATH'])
+
+
 def get_ffmpeg_bin():
     """
     Returns the path to the ffmpeg binary.
     On Android: libffmpegbin.so from nativeLibraryDir (placed by p4a ffmpeg recipe)
     On Desktop: 'ffmpeg' from system PATH.
-    Result is cached after first call.
+    Result is cached after first call — a failed desktop lookup too.
     """
-    global _ffmpeg_bin_cache
+    global _ffmpeg_bin_cache, _ffmpeg_lookup_failed
     if _ffmpeg_bin_cache is not None:
         return _ffmpeg_bin_cache
+    if _ffmpeg_lookup_failed:
+        raise RuntimeError(FFMPEG_INSTALL_HELP)
 
     if ANDROID:
+        from android import mActivity
         app_info = mActivity.getApplicationInfo()
         native_lib_dir = app_info.nativeLibraryDir
         _ffmpeg_bin_cache = os.path.join(native_lib_dir, "libffmpegbin.so")
-
-        existing = os.environ.get("LD_LIBRARY_PATH", "")
-        if native_lib_dir not in existing:
-            os.environ["LD_LIBRARY_PATH"] = (
-                native_lib_dir + (":" + existing if existing else "")
-            )
-        print(f"[FFmpeg] Binary: {_ffmpeg_bin_cache}")
-        print(f"[FFmpeg] LD_LIBRARY_PATH: {os.environ['LD_LIBRARY_PATH']}")
+        _ensure_ld_library_path(native_lib_dir)
+        log.info("[FFmpeg] Binary: %s", _ffmpeg_bin_cache)
     else:
-        found = _find_ffmpeg_on_desktop()
-        if not found:
-            raise RuntimeError(FFMPEG_INSTALL_HELP)
+        found = _read_cached_ffmpeg_path()
+        if found:
+            log.info("[FFmpeg] Cached path: %s", found)
+        else:
+            found = _find_ffmpeg_on_desktop()
+            if not found:
+                _ffmpeg_lookup_failed = True
+                raise RuntimeError(FFMPEG_INSTALL_HELP)
+            _write_cached_ffmpeg_path(found)
         _ffmpeg_bin_cache = found
-        print(f"[FFmpeg] Using: {_ffmpeg_bin_cache}")
+        log.info("[FFmpeg] Using: %s", _ffmpeg_bin_cache)
 
     return _ffmpeg_bin_cache
 
 
+def _prewarm():
+    """Import yt_dlp and resolve ffmpeg off the UI thread, ahead of use."""
+    get_yt_dlp()
+    try:
+        get_ffmpeg_bin()
+    except RuntimeError:
+        pass  # negative-cached; reported when a download actually needs it
+
+
+# (divisor, format) indexed by bytes_count.bit_length(): a value with bit
+# length b lies in [2**(b-1), 2**b), so ≤20 bits is < 1 MB, ≤30 bits < 1 GB.
+_SIZE_TIERS = tuple(
+    (1 << 10, '{:.1f} KB') if bits <= 20 else
+    (1 << 20, '{:.1f} MB') if bits <= 30 else
+    (1 << 30, '{:.2f} GB')
+    for bits in range(32)
+)
+
+
 def format_size(bytes_count):
     """
     Convert a byte count into a human-readable string.
@@ -186,33 +430,176 @@ def format_size(bytes_count):
     """
     if bytes_count <= 0:
         return '0 KB'
-    elif bytes_count < 1024 * 1024:
-        return f'{bytes_count / 1024:.1f} KB'
-    elif bytes_count < 1024 * 1024 * 1024:
-        return f'{bytes_count / (1024 * 1024):.1f} MB'
-    else:
-        return f'{bytes_count / (1024 * 1024 * 1024):.2f} GB'
+    divisor, fmt = _SIZE_TIERS[min(int(bytes_count).bit_length(), 31)]
+    return fmt.format(bytes_count / divisor)
 
 
 # ── yt-dlp logger ──────────────────────────────────────────────────────────────
 class YTDLPLogger:
+    # Stateless, so one shared instance (_YTDLP_LOGGER) serves every
+    # YoutubeDL. Only errors are always logged; debug/warning/write output
+    # is dropped at a single branch unless YTDL_DEBUG is set.
+    __slots__ = ()
+
     def debug(self, msg):
-        pass
+        if _VERBOSE:
+            log.debug("[yt-dlp] %s", msg)
 
     def warning(self, msg):
-        print(f"[yt-dlp WARNING] {msg}")
+        if _VERBOSE:
+            log.warning("[yt-dlp] %s", msg)
 
     def error(self, msg):
-        print(f"[yt-dlp ERROR] {msg}")
+        log.error("[yt-dlp] %s", msg)
 
     def write(self, msg):
-        if msg.strip():
-            print(msg.strip())
+        if _VERBOSE and msg and not msg.isspace():
+            log.info("%s", msg.strip())
 
     def flush(self):
         pass
 
 
+_YTDLP_LOGGER = YTDLPLogger()
+
+
+# ── Deferred logging ───────────────────────────────────────────────────────────
+# On Android stdout is piped to logcat and each write is a locked JNI call.
+# The download path queues its lines here instead; _flush_log drains them with
+# one record from a 0.5 s Clock interval (and once more on app stop). Nothing
+# is dropped: a full queue is flushed on the spot, and any immediate log
+# record drains the queue ahead of itself so lines stay in order.
+_log_queue = deque()
+_LOG_QUEUE_FLUSH_AT = 256
+
+
+def _log(msg):
+    """Queue a log line; safe from any thread."""
+    _log_queue.append(msg)
+    if len(_log_queue) >= _LOG_QUEUE_FLUSH_AT:
+        _flush_log()
+
+
+def _flush_log(dt=None):
+    """Write every queued line as a single log record."""
+    batch = []
+    try:
+        while True:
+            batch.append(_log_queue.popleft())
+    except IndexError:
+        pass
+    if batch:
+        log.info("%s", '\n'.join(batch))
+
+
+def _flush_before(record):
+    """Logger filter: write queued lines before a direct record."""
+    if _log_queue:
+        _flush_log()
+    return True
+
+
+log.addFilter(_flush_before)
+
+
+# ── Worker threads ─────────────────────────────────────────────────────────────
+class _DaemonPool:
+    """
+    A minimal ThreadPoolExecutor stand-in whose workers are daemon threads.
+    ThreadPoolExecutor joins its workers at interpreter exit, so closing the
+    app would wait out an extract_info probe or an ffmpeg merge — neither
+    reaches a progress tick to notice _cancel_flag. Workers start lazily,
+    up to max_workers, and are reused; submit() returns a normal Future, so
+    run_in_executor, wait() and as_completed() work unchanged.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix):
+        self._max_workers = max_workers
+        self._prefix = thread_name_prefix
+        self._queue = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._threads = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn, *args, **kwargs):
+        if self._shutdown:
+            raise RuntimeError('cannot schedule new futures after shutdown')
+        future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        # Same policy as ThreadPoolExecutor: wake an idle worker if there is
+        # one, otherwise start another while under max_workers
+        if not self._idle.acquire(timeout=0):
+            with self._lock:
+                if len(self._threads) < self._max_workers:
+                    thread = threading.Thread(
+                        target=self._worker, daemon=True,
+                        name=f'{self._prefix}_{len(self._threads)}',
+                    )
+                    thread.start()
+                    self._threads.append(thread)
+        return future
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            del item
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+            del future
+            self._idle.release()
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self._shutdown = True
+        if cancel_futures:
+            try:
+                while True:
+                    item = self._queue.get_nowait()
+                    if item is not None:
+                        item[0].cancel()
+            except queue.Empty:
+                pass
+        with self._lock:
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+# Minimum gap between 'downloading' ticks the progress hook acts on (50 ms).
+# 'finished' ticks always go through so the bar reaches 100%.
+_PROGRESS_THROTTLE_NS = 50_000_000
+
+# Notification channel and intent strings, shared by the notification helper
+# and the widget's on_new_intent dispatch.
+_NOTIF_CHANNEL_ID = "download_channel"
+_ACTION_MAIN = "android.intent.action.MAIN"
+_CATEGORY_LAUNCHER = "android.intent.category.LAUNCHER"
+_ACTION_PAUSE = "org.ytdl.ytdlapp.PAUSE"
+_ACTION_CANCEL = "org.ytdl.ytdlapp.CANCEL"
+
+# Minimum gap between running-progress notification updates (250 ms, so at
+# most 4 Hz — Android rate-limits faster updates and drops them anyway).
+_NOTIFY_THROTTLE_NS = 250_000_000
+
+# (lower-case substring of a DownloadError, message shown to the user);
+# first match wins, anything unmatched shows the raw error cut to 80 chars.
+_ERROR_MAP = (
+    ('video unavailable', 'Video is unavailable or private'),
+    ('no video formats',  'Selected quality not available for this video'),
+    ('sign in',           'This video requires login — cannot download'),
+    ('login',             'This video requires login — cannot download'),
+)
+
+
 # ── Android Notification Helper ────────────────────────────────────────────────
 class AndroidNotificationHelper:
     """Helper class for Android notifications using AndroidX"""
@@ -221,21 +608,42 @@ class AndroidNotificationHelper:
         if not ANDROID:
             return
         try:
-            self.Context = autoclass('android.content.Context')
-            self.Build = autoclass('android.os.Build')
-            self.BuildVersion = autoclass('android.os.Build$VERSION')
-            self.BuildVersionCodes = autoclass('android.os.Build$VERSION_CODES')
-            self.NotificationManager = autoclass('android.app.NotificationManager')
-            self.NotificationChannel = autoclass('android.app.NotificationChannel')
-            self.NotificationCompat = autoclass('androidx.core.app.NotificationCompat$Builder')
-            self.Notification = autoclass('android.app.Notification')
-            self.Intent = autoclass('android.content.Intent')
-            self.PendingIntent = autoclass('android.app.PendingIntent')
-            self.RDrawable = autoclass('android.R$drawable')
+            from android import mActivity
+            self._activity = mActivity
+            self.Context = _android_class('android.content.Context')
+            self.Build = _android_class('android.os.Build')
+            self.BuildVersion = _android_class('android.os.Build$VERSION')
+            self.BuildVersionCodes = _android_class('android.os.Build$VERSION_CODES')
+            self.NotificationManager = _android_class('android.app.NotificationManager')
+            self.NotificationChannel = _android_class('android.app.NotificationChannel')
+            self.NotificationCompat = _android_class('androidx.core.app.NotificationCompat$Builder')
+            self.Notification = _android_class('android.app.Notification')
+            self.Intent = _get_intent_class()
+            self.PendingIntent = _android_class('android.app.PendingIntent')
+            self.RDrawable = _android_class('android.R$drawable')
             self._channel_created = False
-            print("[Notification] Helper initialized with AndroidX")
+            # Both live as long as the process — resolve them once, not per tick
+            self._app_context = mActivity.getApplicationContext()
+            self._activity_class = mActivity.getClass()
+            self._launch_pending = None
+            self._nm = self._app_context.getSystemService(self.Context.NOTIFICATION_SERVICE)
+            # update_notification skips rebuilding when nothing visible changed
+            self._last_notif_key = None
+            self._short_name_memo = (None, None)   # (filename, display name)
+            self._builders = {}                    # see _progress_builder
+            self._last_update_ns = 0
+            self._last_state = None                # state of the last posted update
+            # Kept in step by YouTubeDownloaderApp._on_app_start/_on_app_stop
+            self._app_in_foreground = True
+            self._pause_pending = self._cancel_pending = None
+            try:
+                self._build_action_intents()
+            except Exception as e:
+                # Retried when the first button-bearing notification is built
+                log.warning("[Notification] Action intents deferred: %s", e)
+            log.info("[Notification] Helper initialized with AndroidX")
         except Exception as e:
-            print(f"[Notification] Failed to initialize: {e}")
+            log.warning("[Notification] Failed to initialize: %s", e)
             self.NotificationCompat = None
 
     def create_notification_channel(self):
@@ -244,37 +652,28 @@ class AndroidNotificationHelper:
             return
         try:
             if self.BuildVersion.SDK_INT >= self.BuildVersionCodes.O:
-                app_context = mActivity.getApplicationContext()
                 channel = self.NotificationChannel(
-                    "download_channel",
+                    _NOTIF_CHANNEL_ID,
                     "Downloads",
                     self.NotificationManager.IMPORTANCE_LOW
                 )
                 channel.setDescription("YouTube download progress")
-                nm = app_context.getSystemService(self.Context.NOTIFICATION_SERVICE)
-                nm.createNotificationChannel(channel)
+                self._nm.createNotificationChannel(channel)
                 self._channel_created = True
-                print("[Notification] Channel created")
+                log.info("[Notification] Channel created")
         except Exception as e:
-            print(f"[Notification] Channel creation failed: {e}")
+            log.warning("[Notification] Channel creation failed: %s", e)
 
     def start_foreground_service(self, title, message):
         """Start foreground notification"""
         if not self.NotificationCompat:
             return
         try:
-            app_context = mActivity.getApplicationContext()
+            app_context = self._app_context
 
-            intent = self.Intent(app_context, mActivity.getClass())
-            intent.setAction("android.intent.action.MAIN")
-            intent.addCategory("android.intent.category.LAUNCHER")
+            pending_intent = self._launch_pending_intent()
 
-            pending_intent = self.PendingIntent.getActivity(
-                app_context, 0, intent,
-                self.PendingIntent.FLAG_UPDATE_CURRENT | self.PendingIntent.FLAG_IMMUTABLE
-            )
-
-            builder = self.NotificationCompat(app_context, "download_channel")
+            builder = self.NotificationCompat(app_context, _NOTIF_CHANNEL_ID)
             builder.setContentTitle(title)
             builder.setContentText(message)
             builder.setSmallIcon(self.RDrawable.stat_sys_download)
@@ -283,32 +682,49 @@ class AndroidNotificationHelper:
             builder.setProgress(100, 0, True)
 
             notification = builder.build()
-            nm = app_context.getSystemService(self.Context.NOTIFICATION_SERVICE)
-            nm.notify(1, notification)
-            print(f"[Notification] Started: {title}")
+            self._nm.notify(1, notification)
+            self._last_notif_key = None   # notification 1 was replaced
+            log.info("[Notification] Started: %s", title)
         except Exception as e:
-            print(f"[Notification] Start failed: {e}")
+            log.warning("[Notification] Start failed: %s", e)
 
     def update_notification(self, filename, downloaded, total, speed, progress, is_paused=False):
         """Update notification with progress - optimized for visibility"""
         if not self.NotificationCompat:
             return
         try:
-            app_context = mActivity.getApplicationContext()
-
-            intent = self.Intent(app_context, mActivity.getClass())
-            intent.setAction("android.intent.action.MAIN")
-            intent.addCategory("android.intent.category.LAUNCHER")
-
-            pending_intent = self.PendingIntent.getActivity(
-                app_context, 0, intent,
-                self.PendingIntent.FLAG_UPDATE_CURRENT | self.PendingIntent.FLAG_IMMUTABLE
-            )
-
             is_merging = "(Merging..." in str(filename)
-            short_name = os.path.basename(filename).replace(" (Merging...", "").replace(" • Paused", "") if filename else 'Downloading...'
-            if len(short_name) > 30:
-                short_name = short_name[:27] + '...'
+            # At most 4 updates a second within one state (_NOTIFY_THROTTLE_NS).
+            # Any state change — pause, resume, processing, merging, 100%,
+            # buttons shown/hidden — or a freshly replaced notification always
+            # gets through, so it can't be left showing a stale state.
+            now = time.monotonic_ns()
+            state = (bool(is_paused), is_merging, progress < 0, progress >= 100,
+                     self._app_in_foreground)
+            if (state == self._last_state and self._last_notif_key is not None
+                    and now - self._last_update_ns < _NOTIFY_THROTTLE_NS):
+                return
+            self._last_update_ns = now
+            self._last_state = state
+
+            memo_filename, short_name = self._short_name_memo
+            if filename != memo_filename:
+                short_name = os.path.basename(filename).replace(" (Merging...", "").replace(" • Paused", "") if filename else 'Downloading...'
+                if len(short_name) > 30:
+                    short_name = short_name[:27] + '...'
+                self._short_name_memo = (filename, short_name)
+
+            # What the user can actually see: whole percent, KB/s speed, state
+            # and name (plus MB downloaded when there's no total to show %).
+            # An unchanged key means the same notification — skip the JNI work.
+            key = (
+                int(progress), int(speed) >> 10 if speed else 0,
+                bool(is_paused), is_merging, short_name,
+                downloaded >> 20 if total <= 0 else 0,
+            )
+            if key == self._last_notif_key:
+                return
+            self._last_notif_key = key
 
             size_str = f'{format_size(downloaded)}' if downloaded > 0 else '0 KB'
             if total > 0:
@@ -334,13 +750,14 @@ class AndroidNotificationHelper:
                 else:
                     content = size_str if size_str else "Starting..."
 
-            builder = self.NotificationCompat(app_context, "download_channel")
+            # Pause/Cancel buttons only while backgrounded and not merging
+            if is_merging or self._app_in_foreground:
+                actions = None
+            else:
+                actions = 'resume' if is_paused else 'pause'
+            builder = self._progress_builder(actions)
             builder.setContentTitle(title)
             builder.setContentText(content)
-            builder.setSmallIcon(self.RDrawable.stat_sys_download)
-            builder.setContentIntent(pending_intent)
-            builder.setOngoing(True)
-            builder.setOnlyAlertOnce(True)
 
             if is_merging:
                 builder.setProgress(0, 0, True)
@@ -351,64 +768,100 @@ class AndroidNotificationHelper:
             else:
                 builder.setProgress(0, 0, True)
 
+            notification = builder.build()
+            self._nm.notify(1, notification)
+            log.debug("[Notification] Updated: title=%r, progress=%s, is_paused=%s",
+                      short_name, progress, is_paused)
+        except Exception as e:
+            log.warning("[Notification] Update failed: %s", e)
+
+    def _progress_builder(self, actions):
+        """
+        The progress Builder for an action set (None, 'pause' or 'resume').
+        Each is created once with its static parts — icon, tap intent, flags,
+        buttons — and afterwards only its title/text/progress are changed.
+        """
+        builder = self._builders.get(actions)
+        if builder is not None:
+            return builder
+
+        app_context = self._app_context
+
+        pending_intent = self._launch_pending_intent()
+
+        builder = self.NotificationCompat(app_context, _NOTIF_CHANNEL_ID)
+        builder.setSmallIcon(self.RDrawable.stat_sys_download)
+        builder.setContentIntent(pending_intent)
+        builder.setOngoing(True)
+        builder.setOnlyAlertOnce(True)
+
+        if actions:
             try:
-                if not is_merging and not self._app_in_foreground:
-                    pause_intent = self.Intent(app_context, mActivity.getClass())
-                    pause_intent.setAction("org.ytdl.ytdlapp.PAUSE")
-                    pause_pending = self.PendingIntent.getActivity(
-                        app_context, 1, pause_intent,
-                        self.PendingIntent.FLAG_UPDATE_CURRENT | self.PendingIntent.FLAG_IMMUTABLE
-                    )
-                    
-                    cancel_intent = self.Intent(app_context, mActivity.getClass())
-                    cancel_intent.setAction("org.ytdl.ytdlapp.CANCEL")
-                    cancel_pending = self.PendingIntent.getActivity(
-                        app_context, 2, cancel_intent,
-                        self.PendingIntent.FLAG_UPDATE_CURRENT | self.PendingIntent.FLAG_IMMUTABLE
-                    )
-                    
-                    if is_paused:
-                        builder.addAction(self.RDrawable.ic_media_play, "Resume", pause_pending)
-                    else:
-                        builder.addAction(self.RDrawable.ic_media_pause, "Pause", pause_pending)
-                    builder.addAction(self.RDrawable.ic_menu_close_clear_cancel, "Cancel", cancel_pending)
+                if self._cancel_pending is None:   # built last, so set means both are
+                    self._build_action_intents()
+                pause_pending = self._pause_pending
+                cancel_pending = self._cancel_pending
+
+                if actions == 'resume':
+                    builder.addAction(self.RDrawable.ic_media_play, "Resume", pause_pending)
+                else:
+                    builder.addAction(self.RDrawable.ic_media_pause, "Pause", pause_pending)
+                builder.addAction(self.RDrawable.ic_menu_close_clear_cancel, "Cancel", cancel_pending)
             except Exception as e:
-                print(f"[Notification] Action buttons failed: {e}")
+                log.warning("[Notification] Action buttons failed: %s", e)
+
+        self._builders[actions] = builder
+        return builder
+
+    def _launch_pending_intent(self):
+        """Tap-to-open PendingIntent shared by every notification; built on first use."""
+        if self._launch_pending is None:
+            intent = self.Intent(self._app_context, self._activity_class)
+            intent.setAction(_ACTION_MAIN)
+            intent.addCategory(_CATEGORY_LAUNCHER)
+            self._launch_pending = self.PendingIntent.getActivity(
+                self._app_context, 0, intent,
+                self.PendingIntent.FLAG_UPDATE_CURRENT | self.PendingIntent.FLAG_IMMUTABLE
+            )
+        return self._launch_pending
 
-            notification = builder.build()
-            nm = app_context.getSystemService(self.Context.NOTIFICATION_SERVICE)
-            nm.notify(1, notification)
-            print(f"[Notification] Updated: title='{short_name}', progress={progress}, is_paused={is_paused}")
-        except Exception as e:
-            print(f"[Notification] Update failed: {e}")
+    def _build_action_intents(self):
+        """PendingIntents for the Pause/Resume and Cancel buttons — static, so built once."""
+        app_context = self._app_context
+
+        pause_intent = self.Intent(app_context, self._activity_class)
+        pause_intent.setAction(_ACTION_PAUSE)
+        self._pause_pending = self.PendingIntent.getActivity(
+            app_context, 1, pause_intent,
+            self.PendingIntent.FLAG_UPDATE_CURRENT | self.PendingIntent.FLAG_IMMUTABLE
+        )
+
+        cancel_intent = self.Intent(app_context, self._activity_class)
+        cancel_intent.setAction(_ACTION_CANCEL)
+        self._cancel_pending = self.PendingIntent.getActivity(
+            app_context, 2, cancel_intent,
+            self.PendingIntent.FLAG_UPDATE_CURRENT | self.PendingIntent.FLAG_IMMUTABLE
+        )
 
     def cancel_notification(self):
         """Cancel the current notification"""
         try:
-            app_context = mActivity.getApplicationContext()
-            nm = app_context.getSystemService(self.Context.NOTIFICATION_SERVICE)
-            nm.cancel(1)
-            print("[Notification] Cancelled")
+            self._nm.cancel(1)
+            self._last_notif_key = None
+            log.info("[Notification] Cancelled")
         except Exception as e:
-            print(f"[Notification] Cancel failed: {e}")
+            log.warning("[Notification] Cancel failed: %s", e)
 
     def show_completion_notification(self, title, message):
         """Show completion notification with auto-dismiss"""
         if not self.NotificationCompat:
             return
         try:
-            app_context = mActivity.getApplicationContext()
+            app_context = self._app_context
 
-            intent = self.Intent(app_context, mActivity.getClass())
-            intent.setAction("android.intent.action.MAIN")
-            intent.addCategory("android.intent.category.LAUNCHER")
+            pending_intent = self._launch_pending_intent()
 
-            pending_intent = self.PendingIntent.getActivity(
-                app_context, 0, intent,
-                self.PendingIntent.FLAG_UPDATE_CURRENT | self.PendingIntent.FLAG_IMMUTABLE
-            )
-
-            builder = self.NotificationCompat(app_context, "download_channel")
+            builder = self.NotificationCompat(app_context, _NOTIF_CHANNEL_ID)
             builder.setContentTitle(title)
             builder.setContentText(message)
             builder.setSmallIcon(self.RDrawable.stat_sys_download_done)
@@ -416,9 +869,10 @@ class AndroidNotificationHelper:
             builder.setAutoCancel(True)
 
             notification = builder.build()
-            nm = app_context.getSystemService(self.Context.NOTIFICATION_SERVICE)
+            nm = self._nm
             nm.notify(1, notification)
-            print(f"[Notification] Completion shown")
+            self._last_notif_key = None   # notification 1 was replaced
+            log.info("[Notification] Completion shown")
             
             def auto_dismiss():
                 try:
@@ -428,19 +882,18 @@ class AndroidNotificationHelper:
             Clock.schedule_once(lambda dt: auto_dismiss(), 5)
             
         except Exception as e:
-            print(f"[Notification] Completion failed: {e}")
+            log.warning("[Notification] Completion failed: %s", e)
 
     def stop_foreground_service(self):
         """Stop notification"""
         if not self.NotificationCompat:
             return
         try:
-            app_context = mActivity.getApplicationContext()
-            nm = app_context.getSystemService(self.Context.NOTIFICATION_SERVICE)
-            nm.cancel(1)
-            print("[Notification] Cancelled")
+            self._nm.cancel(1)
+            self._last_notif_key = None
+            log.info("[Notification] Cancelled")
         except Exception as e:
-            print(f"[Notification] Stop failed: {e}")
+            log.warning("[Notification] Stop failed: %s", e)
 
 
 # ── Main widget ────────────────────────────────────────────────────────────────
@@ -460,37 +913,114 @@ class YouTubeDownloader(BoxLayout):
     total_items = NumericProperty(0)
     download_size = StringProperty('')
 
+    # Concurrent downloads when several URLs are pasted at once.
+    # Kept small on purpose — YouTube throttles aggressive clients.
+    num_workers = NumericProperty(5)
+
+    # ── yt-dlp option templates ───────────────────────────────────────────────
+    # Built once at import. download_video copies the base into a fresh dict
+    # per download and layers the per-mode template on top — yt-dlp only
+    # reads these, so the nested postprocessor list is safe to share.
+    _YDL_BASE_OPTS = {
+        'quiet': False,
+        'no_warnings': False,
+        'noprogress': False,
+        'nocheckcertificate': True,
+        'continuedl': True,
+        # DASH/HLS fragments fetched 8 at a time by yt-dlp's own thread pool;
+        # plain HTTPS formats are pulled in 10 MB ranged chunks.
+        'concurrent_fragment_downloads': 8,
+        'http_chunk_size': 10 * 1024 * 1024,
+    }
+    _YDL_AUDIO_M4A_OPTS = {
+        'format': 'bestaudio[ext=m4a]/bestaudio',
+    }
+    _YDL_AUDIO_MP3_OPTS = {
+        'format': 'bestaudio/best',
+        'postprocessors': [{
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': 'mp3',
+            'preferredquality': '192',
+        }],
+        'prefer_ffmpeg': True,
+    }
+    _YDL_VIDEO_OPTS = {
+        'merge_output_format': 'mp4',
+    }
+    # quality_selected → (android format, desktop format)
+    _QUALITY_MAP = {
+        'max':   ('best',               'bestvideo+bestaudio/best'),
+        '1080p': ('best[height<=1080]',  'bestvideo[height<=1080]+bestaudio/best[height<=1080]'),
+        '720':   ('best[height<=720]',   'bestvideo[height<=720]+bestaudio/best[height<=720]'),
+        '480':   ('best[height<=480]',   'bestvideo[height<=480]+bestaudio/best[height<=480]'),
+    }
+
     def __init__(self, **kwargs):
         # ── ALL instance vars MUST be set before super().__init__() ───────────
         # Kivy dispatches on_kv_post from inside super().__init__() (via
         # widget.py → EventDispatcher.dispatch). If on_kv_post runs before
         # these attributes exist we get AttributeError and the app crashes.
         self._pending_shared_url = None   # URL buffered until UI is ready
+        self._url_input = None            # cached ids.url_input, set in on_kv_post
+        self._download_urls = []          # validated in start_download, read by the worker
+        self._cancel_popup = None         # built on first Cancel tap, then reused
         self._pause_event = threading.Event()
         self._pause_event.set()           # start in running state
         self._cancel_flag = False
-        self._download_thread = None
+        self._download_task = None
+        # Long-lived worker threads for the blocking yt-dlp call, reused
+        # across downloads. More than one so a new download never queues
+        # behind a cancelled one that is still unwinding.
+        self._download_executor = _DaemonPool(
+            max_workers=4, thread_name_prefix='download'
+        )
+        self._batch_executor = None       # created on first multi-URL download
+        self._batch_workers = 0           # size _batch_executor was built with
+        self._batch_abort = False         # one batch URL failed — stop the rest
         self._current_output_path = None
+        self._storage_ready = False       # set once setup_storage resolves real paths
         self._notification_helper = None
         self._postprocessing = False
         self._last_total = 0
         self._app_in_foreground = True
+        # Debounced validation — runs once, 0.3 s after typing/pasting stops
+        self._validate_trigger = Clock.create_trigger(self._do_validate, 0.3)
+        # Progress from the hook is parked here and flushed at ~15 Hz
+        self._pending_progress = None
+        self._progress_flush_scheduled = False
+        # Hook ticks closer together than _PROGRESS_THROTTLE_NS are dropped
+        self._last_progress_emit_ns = 0
+        # current_item is only recomputed when the filename changes
+        self._last_filename = None
+        # One reusable ClockEvent; triggering it while pending is a no-op
+        self._clear_success_trigger = Clock.create_trigger(self._clear_success, 7)
 
         super().__init__(**kwargs)        # on_kv_post may fire here
 
-        print(f"[App] __init__ complete. ANDROID={ANDROID}")
+        log.info("[App] __init__ complete. ANDROID=%s", ANDROID)
 
         if ANDROID:
-            print("[App] Requesting permissions...")
-            request_permissions(
-                [
+            from android.permissions import request_permissions, check_permission, Permission
+            # READ_MEDIA_* / POST_NOTIFICATIONS only exist from API 33, where
+            # WRITE_EXTERNAL_STORAGE is always reported denied — ask per level
+            # so an already-granted set is recognised as such.
+            if _get_sdk_int() >= 33:
+                needed = [
                     Permission.READ_MEDIA_VIDEO,
                     Permission.READ_MEDIA_AUDIO,
-                    Permission.WRITE_EXTERNAL_STORAGE,
                     Permission.POST_NOTIFICATIONS,
-                ],
-                self.on_permissions_result
-            )
+                ]
+            else:
+                needed = [Permission.WRITE_EXTERNAL_STORAGE]
+            missing = [p for p in needed if not check_permission(p)]
+            if missing:
+                log.info("[App] Requesting permissions: %s", missing)
+                request_permissions(missing, self.on_permissions_result)
+            else:
+                # Skip the system dialog round trip; still run the storage
+                # manager check and setup_storage() via the usual handler.
+                log.info("[App] Permissions already granted")
+                self.on_permissions_result(needed, [True] * len(needed))
         else:
             self.setup_storage()
 
@@ -502,19 +1032,36 @@ class YouTubeDownloader(BoxLayout):
         This is the ONLY place we trigger intent reading on Android —
         it guarantees the UI exists before we try to paste a URL into it.
         """
-        print("[App] on_kv_post fired — UI (self.ids) is now ready")
+        log.info("[App] on_kv_post fired — UI (self.ids) is now ready")
+        self._url_input = self.ids.url_input
+
+        # Plain forwarding buttons are wired here with fbind rather than
+        # `on_release: root.x()` in design.kv — fbind skips the KV handler
+        # closure and is the fastest dispatch path Kivy offers.
+        ids = self.ids
+        ids.paste_btn.fbind('on_release', self.on_paste_click)
+        ids.download_btn.fbind('on_release', self.start_download)
+        ids.pause_btn.fbind('on_release', self.on_pause_resume_click)
+        ids.cancel_btn.fbind('on_release', self.on_cancel_click)
 
         # Flush any URL that arrived before the UI was built
         if self._pending_shared_url:
-            print(f"[Intent] Flushing buffered URL from on_kv_post: {self._pending_shared_url}")
+            log.debug("[Intent] Flushing buffered URL from on_kv_post: %s", self._pending_shared_url)
             self._apply_url(self._pending_shared_url)
             self._pending_shared_url = None
 
         if ANDROID:
             # 0.5 s delay lets the Android activity fully settle after launch
-            print("[Intent] Scheduling _read_intent in 0.5 s...")
+            log.debug("[Intent] Scheduling _read_intent in 0.5 s...")
             Clock.schedule_once(lambda dt: self._read_intent(), 0.5)
 
+        # Warm the yt_dlp import and the ffmpeg lookup on a worker once the
+        # first frame is up, so the first Download tap pays for neither (the
+        # import lock makes a racing get_yt_dlp() simply wait for it)
+        Clock.schedule_once(
+            lambda dt: self._download_executor.submit(_prewarm), 0
+        )
+
     # ── Intent handling ────────────────────────────────────────────────────────
 
     def _read_intent(self):
@@ -528,72 +1075,69 @@ class YouTubeDownloader(BoxLayout):
 
         All exceptions are caught and logged — a broken intent can never crash the app.
         """
-        print("[Intent] _read_intent called")
+        log.debug("[Intent] _read_intent called")
 
         if not ANDROID:
-            print("[Intent] Not Android — skipping")
+            log.debug("[Intent] Not Android — skipping")
             return
 
         try:
-            from jnius import autoclass
-            Intent = autoclass('android.content.Intent')
-            print("[Intent] jnius autoclass OK")
+            from android import mActivity
+            Intent = _get_intent_class()
+            log.debug("[Intent] jnius autoclass OK")
 
             intent = mActivity.getIntent()
             if intent is None:
-                print("[Intent] mActivity.getIntent() returned None — nothing to handle")
+                log.debug("[Intent] mActivity.getIntent() returned None — nothing to handle")
                 return
 
             action   = intent.getAction()
             mimetype = intent.getType()
-            print(f"[Intent] action  = {action}")
-            print(f"[Intent] mime    = {mimetype}")
+            log.debug("[Intent] action  = %s", action)
+            log.debug("[Intent] mime    = %s", mimetype)
 
             if action != Intent.ACTION_SEND:
-                print(f"[Intent] action is not ACTION_SEND — ignoring")
+                log.debug("[Intent] action is not ACTION_SEND — ignoring")
                 return
 
             if mimetype != 'text/plain':
-                print(f"[Intent] mime is not text/plain — ignoring")
+                log.debug("[Intent] mime is not text/plain — ignoring")
                 return
 
             shared_text = intent.getStringExtra(Intent.EXTRA_TEXT)
-            print(f"[Intent] EXTRA_TEXT = {repr(shared_text)}")
+            log.debug("[Intent] EXTRA_TEXT = %r", shared_text)
 
             if not shared_text:
-                print("[Intent] EXTRA_TEXT is empty — nothing to do")
+                log.debug("[Intent] EXTRA_TEXT is empty — nothing to do")
                 return
 
             # ── Extract YouTube URL ────────────────────────────────────────────
             # YouTube share text is typically:
             #   "Video Title https://youtu.be/xxxx"
             # or just the URL. The regex finds the first YouTube URL in the string.
-            pattern = r'https?://(?:www\.)?(?:youtube\.com/watch\?[^\s]+|youtu\.be/[^\s]+)'
-            match = re.search(pattern, shared_text)
+            url = _extract_yt_url(shared_text)
 
-            if match:
-                url = match.group(0)
-                print(f"[Intent] URL extracted by regex: {url}")
+            if url:
+                log.debug("[Intent] URL extracted: %s", url)
             else:
                 # Fall back to the whole text stripped
                 url = shared_text.strip()
-                print(f"[Intent] No regex match — using full text as URL: {url}")
+                log.debug("[Intent] No YouTube URL found — using full text as URL: %s", url)
 
             if not self.validate_url(url):
-                print(f"[Intent] validate_url FAILED for: {url}")
-                print("[Intent] URL rejected — not a recognised YouTube URL")
+                log.warning("[Intent] validate_url FAILED for: %s", url)
+                log.debug("[Intent] URL rejected — not a recognised YouTube URL")
                 return
 
-            print(f"[Intent] URL is valid: {url}")
+            log.debug("[Intent] URL is valid: %s", url)
 
             # ── STEP 1: Clipboard ─────────────────────────────────────────────
             # Done first so the user always has the URL even if the UI paste fails.
             try:
-                from kivy.core.clipboard import Clipboard
                 Clipboard.copy(url)
-                print(f"[Intent] STEP 1 OK — URL copied to clipboard: {url}")
+                log.debug("[Intent] STEP 1 OK — URL copied to clipboard: %s", url)
             except Exception as clip_err:
-                print(f"[Intent] STEP 1 FAILED — clipboard copy error: {clip_err}")
+                log.warning("[Intent] STEP 1 FAILED — clipboard copy error: %s", clip_err)
 
             # ── STEP 2: Paste into input field ────────────────────────────────
             self._apply_url(url)
@@ -603,18 +1147,16 @@ class YouTubeDownloader(BoxLayout):
             # to the app after navigating away (e.g. after visiting Settings).
             try:
                 mActivity.setIntent(None)
-                print("[Intent] STEP 3 OK — intent cleared (setIntent(None))")
+                log.debug("[Intent] STEP 3 OK — intent cleared (setIntent(None))")
             except Exception as clear_err:
-                print(f"[Intent] STEP 3 FAILED — could not clear intent: {clear_err}")
+                log.warning("[Intent] STEP 3 FAILED — could not clear intent: %s", clear_err)
 
         except Exception as e:
-            import traceback
-            print(f"[Intent] _read_intent EXCEPTION: {type(e).__name__}: {e}")
-            print(traceback.format_exc())
+            log.exception("[Intent] _read_intent EXCEPTION: %s: %s", type(e).__name__, e)
 
     def _apply_url(self, url):
         """
-        Write url into self.ids.url_input.
+        Write url into the URL input field.
 
         _on_new_intent_activity fires on the Android thread, not the Kivy
         thread. Writing to widgets from a non-Kivy thread raises:
@@ -623,22 +1165,22 @@ class YouTubeDownloader(BoxLayout):
         which guarantees it runs on the Kivy main thread regardless of which
         thread _apply_url was called from.
         """
-        print(f"[Intent] _apply_url called with: {url} — scheduling on Kivy thread")
+        log.debug("[Intent] _apply_url called with: %s — scheduling on Kivy thread", url)
         Clock.schedule_once(lambda dt: self._write_url_to_field(url), 0)
 
     def _write_url_to_field(self, url):
         """Runs on the Kivy main thread — safe to touch widgets."""
-        print(f"[Intent] _write_url_to_field: writing to input field")
+        log.debug("[Intent] _write_url_to_field: writing to input field")
         try:
-            input_widget = self.ids.url_input
+            input_widget = self._url_input
             self.url_text = url
             input_widget.text = url
             self.error_message  = ''
             self.success_message = ''
-            print(f"[Intent] STEP 2 OK — URL written to input field: {url}")
+            log.debug("[Intent] STEP 2 OK — URL written to input field: %s", url)
         except Exception as e:
-            print(f"[Intent] STEP 2 FAILED — ({type(e).__name__}: {e})")
-            print(f"[Intent] Buffering URL — on_kv_post will retry")
+            log.warning("[Intent] STEP 2 FAILED — (%s: %s)", type(e).__name__, e)
+            log.debug("[Intent] Buffering URL — on_kv_post will retry")
             self._pending_shared_url = url
 
     def on_new_intent(self, intent):
@@ -654,53 +1196,50 @@ class YouTubeDownloader(BoxLayout):
           2. Copy to clipboard on the Android thread (safe).
           3. Hand off ALL widget writes to the Kivy thread via Clock.schedule_once.
         """
-        print("[Intent] on_new_intent — app backgrounded, new share received")
+        log.debug("[Intent] on_new_intent — app backgrounded, new share received")
         if not ANDROID:
             return
         try:
-            from jnius import autoclass
-            Intent = autoclass('android.content.Intent')
+            from android import mActivity
+            Intent = _get_intent_class()
 
             action   = intent.getAction()
             mimetype = intent.getType()
-            print(f"[Intent] on_new_intent: action={action}  mime={mimetype}")
+            log.debug("[Intent] on_new_intent: action=%s  mime=%s", action, mimetype)
 
-            if action == "org.ytdl.ytdlapp.PAUSE":
-                print("[Intent] Pause action received")
+            if action == _ACTION_PAUSE:
+                log.debug("[Intent] Pause action received")
                 Clock.schedule_once(lambda dt: self._handle_pause_action(), 0)
                 return
             
-            if action == "org.ytdl.ytdlapp.CANCEL":
-                print("[Intent] Cancel action received")
+            if action == _ACTION_CANCEL:
+                log.debug("[Intent] Cancel action received")
                 Clock.schedule_once(lambda dt: self._handle_cancel_action(), 0)
                 return
 
             if action != Intent.ACTION_SEND or mimetype != 'text/plain':
-                print("[Intent] on_new_intent: not a text/plain share — ignoring")
+                log.debug("[Intent] on_new_intent: not a text/plain share — ignoring")
                 return
 
             shared_text = intent.getStringExtra(Intent.EXTRA_TEXT)
-            print(f"[Intent] on_new_intent: EXTRA_TEXT={repr(shared_text)}")
+            log.debug("[Intent] on_new_intent: EXTRA_TEXT=%r", shared_text)
             if not shared_text:
-                print("[Intent] on_new_intent: EXTRA_TEXT empty — nothing to do")
+                log.debug("[Intent] on_new_intent: EXTRA_TEXT empty — nothing to do")
                 return
 
-            pattern = r'https?://(?:www\.)?(?:youtube\.com/watch\?[^\s]+|youtu\.be/[^\s]+)'
-            match = re.search(pattern, shared_text)
-            url = match.group(0) if match else shared_text.strip()
-            print(f"[Intent] on_new_intent: extracted url={url}")
+            url = _extract_yt_url(shared_text) or shared_text.strip()
+            log.debug("[Intent] on_new_intent: extracted url=%s", url)
 
             if not self.validate_url(url):
-                print("[Intent] on_new_intent: not a valid YouTube URL — ignoring")
+                log.debug("[Intent] on_new_intent: not a valid YouTube URL — ignoring")
                 return
 
             # ── Clipboard (safe on Android thread) ────────────────────────────
             try:
-                from kivy.core.clipboard import Clipboard
                 Clipboard.copy(url)
-                print("[Intent] on_new_intent: URL copied to clipboard")
+                log.debug("[Intent] on_new_intent: URL copied to clipboard")
             except Exception as ce:
-                print(f"[Intent] on_new_intent: clipboard copy failed: {ce}")
+                log.warning("[Intent] on_new_intent: clipboard copy failed: %s", ce)
 
             # ── Store intent on activity (safe on Android thread) ─────────────
             mActivity.setIntent(intent)
@@ -708,68 +1247,67 @@ class YouTubeDownloader(BoxLayout):
             # ── All widget writes → Kivy main thread via Clock.schedule_once ──
             # _apply_url already uses Clock internally, but we also need to
             # clear the old URL — do that in the same scheduled call.
-            print("[Intent] on_new_intent: scheduling UI update on Kivy thread")
+            log.debug("[Intent] on_new_intent: scheduling UI update on Kivy thread")
             Clock.schedule_once(lambda dt: self._on_new_intent_kivy_thread(url), 0)
 
         except Exception as e:
-            import traceback
-            print(f"[Intent] on_new_intent ERROR: {type(e).__name__}: {e}")
-            print(traceback.format_exc())
+            log.exception("[Intent] on_new_intent ERROR: %s: %s", type(e).__name__, e)
 
     def _on_new_intent_kivy_thread(self, url):
         """
         Runs on the Kivy main thread — safe to read/write widgets here.
         Clears the old URL then writes the new one.
         """
-        print(f"[Intent] _on_new_intent_kivy_thread: updating UI with url={url}")
+        log.debug("[Intent] _on_new_intent_kivy_thread: updating UI with url=%s", url)
         try:
             self.url_text = ''
-            self.ids.url_input.text = ''
+            self._url_input.text = ''
             self.error_message = ''
             self.success_message = ''
-            print("[Intent] Input field cleared")
+            log.debug("[Intent] Input field cleared")
         except Exception as e:
-            print(f"[Intent] Could not clear input field: {e}")
+            log.warning("[Intent] Could not clear input field: %s", e)
         # _write_url_to_field is already on Kivy thread — call directly
         self._write_url_to_field(url)
 
     # ── Permissions ────────────────────────────────────────────────────────────
 
     def on_permissions_result(self, permissions, grants):
-        print("[Permissions] on_permissions_result called")
-        for perm, granted in zip(permissions, grants):
-            status = 'GRANTED' if granted else 'DENIED'
-            print(f"[Permissions]   {perm.split('.')[-1]}: {status}")
+        lines = [
+            f"[Permissions]   {perm.rpartition('.')[2]}: "
+            f"{'GRANTED' if granted else 'DENIED'}"
+            for perm, granted in zip(permissions, grants)
+        ]
+        log.info("[Permissions] on_permissions_result called\n%s", "\n".join(lines))
 
         if ANDROID:
             try:
-                from jnius import autoclass
-                Environment = autoclass('android.os.Environment')
-                Build = autoclass('android.os.Build')
-                BuildVersion = autoclass('android.os.Build$VERSION')
+                from android import mActivity
+                Environment = _android_class('android.os.Environment')
+                sdk_int = _get_sdk_int()
 
-                print(f"[Permissions] Android SDK version: {BuildVersion.SDK_INT}")
+                log.info("[Permissions] Android SDK version: %s", sdk_int)
 
-                if BuildVersion.SDK_INT >= 30:
+                if sdk_int >= 30:
                     is_manager = Environment.isExternalStorageManager()
-                    print(f"[Permissions] isExternalStorageManager: {is_manager}")
+                    log.info("[Permissions] isExternalStorageManager: %s", is_manager)
                     if not is_manager:
-                        Intent = autoclass('android.content.Intent')
-                        Settings = autoclass('android.provider.Settings')
-                        Uri = autoclass('android.net.Uri')
+                        Intent = _get_intent_class()
+                        Settings = _android_class('android.provider.Settings')
+                        Uri = _android_class('android.net.Uri')
                         intent = Intent(
                             Settings.ACTION_MANAGE_APP_ALL_FILES_ACCESS_PERMISSION
                         )
                         intent.setData(Uri.parse('package:org.ytdl.ytdlapp'))
                         mActivity.startActivity(intent)
-                        print("[Permissions] Sent user to All Files Access settings")
+                        log.info("[Permissions] Sent user to All Files Access settings")
                 else:
-                    print("[Permissions] SDK < 30 — no MANAGE_EXTERNAL_STORAGE needed")
+                    log.info("[Permissions] SDK < 30 — no MANAGE_EXTERNAL_STORAGE needed")
 
             except Exception as e:
-                print(f"[Permissions] Storage manager check error: {e}")
+                log.warning("[Permissions] Storage manager check error: %s", e)
 
-        print("[Permissions] Calling setup_storage()")
+        log.info("[Permissions] Calling setup_storage()")
         self.setup_storage()
         # Intent is handled in on_kv_post — do NOT schedule it here.
         # on_permissions_result may fire before on_kv_post on some devices.
@@ -778,128 +1316,157 @@ class YouTubeDownloader(BoxLayout):
 
     def is_wsl(self):
         """Detect if running inside WSL"""
-        try:
-            with open('/proc/version', 'r') as f:
-                content = f.read().lower()
-                return 'microsoft' in content or 'wsl' in content
-        except Exception:
-            return False
+        return _is_wsl()
 
     def get_windows_username(self):
-        """Get Windows username when running in WSL"""
+        """
+        Windows username under WSL, resolved once per process and persisted
+        to ~/.cache/ytdl-app/winuser so later launches skip the probe (and
+        its possible cmd.exe spawn) altogether.
+        """
+        global _windows_username_cache
+        if _windows_username_cache is not None:
+            return _windows_username_cache
+
+        username = None
         try:
-            result = subprocess.run(
-                ['cmd.exe', '/c', 'echo', '%USERNAME%'],
-                capture_output=True, text=True, timeout=2
-            )
-            username = result.stdout.strip()
-            if username and username != '%USERNAME%':
-                return username
-        except Exception:
+            with open(_WINUSER_CACHE_FILE, "r") as f:
+                username = f.read().strip()
+        except OSError:
             pass
+        # Only trust the saved name while its profile folder still exists
+        if not (username and os.path.isdir(f'/mnt/c/Users/{username}')):
+            username = self._probe_windows_username()
+            if username:
+                try:
+                    os.makedirs(os.path.dirname(_WINUSER_CACHE_FILE), exist_ok=True)
+                    tmp = _WINUSER_CACHE_FILE + '.tmp'
+                    with open(tmp, "w") as f:
+                        f.write(username)
+                    os.replace(tmp, _WINUSER_CACHE_FILE)
+                except OSError as e:
+                    log.warning("[Storage] Could not save Windows username cache: %s", e)
+
+        _windows_username_cache = username
+        return username
+
+    def _probe_windows_username(self):
+        """
+        Work out the Windows username from inside WSL.
+
+        One scandir of /mnt/c/Users settles it when there is a single account
+        folder — no process spawn. Only when that is ambiguous do we ask
+        cmd.exe (~100-300 ms of fork + shell start-up under WSL), falling
+        back to the first folder found.
+        """
+        skip = {'Public', 'Default', 'Default User', 'All Users'}
+        users = []
+        try:
+            with os.scandir('/mnt/c/Users') as it:
+                for e in it:
+                    if e.name not in skip and e.is_dir(follow_symlinks=False):
+                        users.append(e.name)
+                        if len(users) == 2:
+                            break   # already ambiguous — the rest can't help
+        except OSError:
+            pass
+
+        if len(users) == 1:
+            return users[0]
 
         try:
             result = subprocess.run(
-                ['powershell.exe', '-Command', '$env:USERNAME'],
-                capture_output=True, text=True, timeout=2
+                ['cmd.exe', '/c', 'echo', '%USERNAME%'],
+                capture_output=True, text=True, timeout=1
             )
             username = result.stdout.strip()
-            if username:
+            if username and username != '%USERNAME%':
                 return username
         except Exception:
             pass
 
-        try:
-            users_dir = '/mnt/c/Users'
-            if os.path.exists(users_dir):
-                skip = {'Public', 'Default', 'Default User', 'All Users'}
-                users = [
-                    d for d in os.listdir(users_dir)
-                    if os.path.isdir(os.path.join(users_dir, d)) and d not in skip
-                ]
-                if users:
-                    return users[0]
-        except Exception:
-            pass
+        if users:
+            return users[0]
 
         return None
 
     def setup_storage(self):
         """Setup download paths for Android, Desktop, or WSL."""
-        print("[Storage] setup_storage() called")
+        log.info("[Storage] setup_storage() called")
+        if self._storage_ready:
+            # Paths can't change once resolved — e.g. a permission re-grant
+            log.info("[Storage] Already set up — skipping")
+            return
         try:
             if ANDROID:
-                from jnius import autoclass
-                Environment = autoclass('android.os.Environment')
-                downloads_dir = Environment.getExternalStoragePublicDirectory(
-                    Environment.DIRECTORY_DOWNLOADS
-                ).getAbsolutePath()
+                downloads_dir = _get_android_downloads_dir()
                 base_path = os.path.join(downloads_dir, 'YouTubeDownloader')
-                print(f"[Storage] Android Downloads: {base_path}")
+                log.info("[Storage] Android Downloads: %s", base_path)
 
             elif self.is_wsl():
-                print("[Storage] Running in WSL")
+                log.info("[Storage] Running in WSL")
                 windows_user = self.get_windows_username()
                 if windows_user:
                     base_path = f'/mnt/c/Users/{windows_user}/Downloads/YouTubeDownloader'
-                    print(f"[Storage] Windows Downloads for user: {windows_user}")
+                    log.info("[Storage] Windows Downloads for user: %s", windows_user)
                 else:
                     base_path = str(Path.home() / "Downloads" / "YouTubeDownloader")
-                    print(f"[Storage] WSL fallback: {base_path}")
+                    log.info("[Storage] WSL fallback: %s", base_path)
 
             else:
                 base_path = str(Path.home() / "Downloads" / "YouTubeDownloader")
-                print(f"[Storage] Desktop: {base_path}")
+                log.info("[Storage] Desktop: %s", base_path)
 
-            self.audio_path = os.path.join(base_path, 'Audio')
-            self.video_path = os.path.join(base_path, 'Video')
-            os.makedirs(self.audio_path, exist_ok=True)
-            os.makedirs(self.video_path, exist_ok=True)
-            print(f"[Storage] Audio path: {self.audio_path}")
-            print(f"[Storage] Video path: {self.video_path}")
+            self._ensure_dirs(base_path)
+            self._storage_ready = True
+            log.info("[Storage] Audio path: %s", self.audio_path)
+            log.info("[Storage] Video path: %s", self.video_path)
 
         except Exception as e:
-            print(f"[Storage] Setup error: {e} — using fallback")
+            log.warning("[Storage] Setup error: %s — using fallback", e)
             fallback = os.path.join(os.getcwd(), 'downloads')
-            self.audio_path = os.path.join(fallback, 'Audio')
-            self.video_path = os.path.join(fallback, 'Video')
-            os.makedirs(self.audio_path, exist_ok=True)
-            os.makedirs(self.video_path, exist_ok=True)
-            print(f"[Storage] Fallback path: {fallback}")
+            self._ensure_dirs(fallback)
+            log.info("[Storage] Fallback path: %s", fallback)
 
         if ANDROID and self._notification_helper is None:
             self._notification_helper = AndroidNotificationHelper()
             self._notification_helper.create_notification_channel()
 
+    def _ensure_dirs(self, base):
+        """Point audio_path/video_path under base and create both folders."""
+        self.audio_path = os.path.join(base, 'Audio')
+        self.video_path = os.path.join(base, 'Video')
+        # One stat when the folder already exists; makedirs walks the tree
+        for path in (self.audio_path, self.video_path):
+            if not os.path.isdir(path):
+                os.makedirs(path, exist_ok=True)
+
     # ── URL helpers ────────────────────────────────────────────────────────────
 
     def validate_url(self, url):
         """Validate if the URL is a valid YouTube URL"""
-        if not url.strip():
-            return False
-        try:
-            parsed = urlparse(url)
-            return 'youtube.com' in parsed.netloc or 'youtu.be' in parsed.netloc
-        except Exception:
-            return False
+        return _YT_RE.match(url) is not None
 
     def is_playlist(self, url):
         """Check if URL points to a playlist"""
-        return 'playlist' in url.lower() or 'list=' in url
+        return _PLAYLIST_RE.search(url) is not None
+
+    def split_urls(self, text):
+        """Split the input field into individual URLs (space/newline separated)"""
+        return text.split()
 
     # ── UI event handlers ──────────────────────────────────────────────────────
 
-    def on_paste_click(self):
+    def on_paste_click(self, *args):
         """Handle paste button click"""
         try:
-            from kivy.core.clipboard import Clipboard
             text = Clipboard.paste()
             if text:
-                self.ids.url_input.text = text
+                self._url_input.text = text
                 self.url_text = text
                 self.error_message = ''
         except Exception as e:
-            print(f"[Clipboard] Error: {e}")
+            log.warning("[Clipboard] Error: %s", e)
             self.error_message = 'Unable to paste from clipboard'
 
     def on_url_change(self, text):
@@ -907,6 +1474,13 @@ class YouTubeDownloader(BoxLayout):
         self.url_text = text
         self.error_message = ''
         self.success_message = ''
+        self._validate_trigger()
+
+    def _do_validate(self, dt):
+        """Deferred by _validate_trigger — flag bad input once typing settles."""
+        urls = self.split_urls(self.url_text)
+        if urls and not all(self.validate_url(u) for u in urls):
+            self.error_message = 'Please enter a valid YouTube URL'
 
     def on_quality_select(self, quality):
         """Handle quality selection"""
@@ -923,12 +1497,12 @@ class YouTubeDownloader(BoxLayout):
 
     # ── Pause / Resume ─────────────────────────────────────────────────────────
 
-    def on_pause_resume_click(self):
+    def on_pause_resume_click(self, *args):
         """Toggle between paused and running state."""
         if self.is_paused:
             self.is_paused = False
             self._pause_event.set()
-            print("[Control] Download RESUMED")
+            log.info("[Control] Download RESUMED")
             if self._notification_helper:
                 filename = self.current_item if self.current_item else 'Downloading...'
                 downloaded = int((self.download_progress / 100) * self._last_total) if self._last_total and self.download_progress > 0 else 0
@@ -938,7 +1512,7 @@ class YouTubeDownloader(BoxLayout):
         else:
             self.is_paused = True
             self._pause_event.clear()
-            print("[Control] Download PAUSED")
+            log.info("[Control] Download PAUSED")
             if self._notification_helper:
                 filename = self.current_item if self.current_item else 'Downloading...'
                 downloaded = int((self.download_progress / 100) * self._last_total) if self._last_total and self.download_progress > 0 else 0
@@ -948,149 +1522,95 @@ class YouTubeDownloader(BoxLayout):
 
     # ── Cancel with confirmation ───────────────────────────────────────────────
 
-    def on_cancel_click(self):
-        """Show a well-spaced Android-friendly confirmation popup."""
-        from kivy.metrics import dp, sp
-
-        msg = Label(
-            text='Cancel the current download?\nThe incomplete file will be deleted.',
-            font_size=sp(15),
-            color=(0.88, 0.88, 0.88, 1),
-            halign='center',
-            valign='middle',
-            size_hint_y=None,
-            height=dp(72),
-        )
-        msg.bind(size=msg.setter('text_size'))
-
-        divider = BoxLayout(size_hint_y=None, height=dp(1))
-        with divider.canvas.before:
-            from kivy.graphics import Color as GColor, Rectangle as GRect
-            GColor(0.72, 0.15, 0.15, 1)
-            divider._rect = GRect(pos=divider.pos, size=divider.size)
-        def _update_div(instance, value):
-            instance._rect.pos  = instance.pos
-            instance._rect.size = instance.size
-        divider.bind(pos=_update_div, size=_update_div)
-
-        btn_no = Button(
-            text='No',
-            background_normal='',
-            background_color=(0.20, 0.20, 0.20, 1),
-            color=(0.88, 0.88, 0.88, 1),
-            font_size=sp(15),
-            bold=True,
-            size_hint_y=None,
-            height=dp(54),
-        )
-
-        btn_yes = Button(
-            text='Yes, Cancel',
-            background_normal='',
-            background_color=(0.72, 0.15, 0.15, 1),
-            color=(1, 1, 1, 1),
-            font_size=sp(15),
-            bold=True,
-            size_hint_y=None,
-            height=dp(54),
-        )
-
-        btn_row = BoxLayout(
-            orientation='horizontal',
-            spacing=dp(10),
-            size_hint_y=None,
-            height=dp(54),
-        )
-        btn_row.add_widget(btn_no)
-        btn_row.add_widget(btn_yes)
-
-        content = BoxLayout(
-            orientation='vertical',
-            padding=[dp(20), dp(18), dp(20), dp(18)],
-            spacing=dp(14),
-        )
-        content.add_widget(msg)
-        content.add_widget(divider)
-        content.add_widget(btn_row)
-
-        total_h = dp(18) + dp(72) + dp(1) + dp(14)*2 + dp(54) + dp(18)
-
-        popup = Popup(
-            title='Cancel Download',
-            title_color=(1, 1, 1, 1),
-            title_size=sp(16),
-            title_align='center',
-            content=content,
-            size_hint=(0.86, None),
-            height=total_h + dp(48),
-            background='',
-            background_color=(0.12, 0.12, 0.12, 1),
-            separator_color=(0.72, 0.15, 0.15, 1),
-            separator_height=dp(2),
-            auto_dismiss=False,
-        )
+    def on_cancel_click(self, *args):
+        """Show the cancel confirmation popup (built on first use, then reused)."""
+        if self._cancel_popup is None:
+            self._cancel_popup = self._build_cancel_popup()
+        self._cancel_popup.open()
 
-        btn_no.bind(on_release=lambda _: popup.dismiss())
-        btn_yes.bind(on_release=lambda _: self._confirm_cancel(popup))
-        popup.open()
+    def _build_cancel_popup(self):
+        """Load the CancelConfirmPopup rule on first use and instantiate it."""
+        Builder.load_file('cancel_popup.kv')
+        popup = Factory.CancelConfirmPopup()
+        popup.ids.yes_btn.bind(on_release=self._confirm_cancel)
+        return popup
 
-    def _confirm_cancel(self, popup):
+    def _confirm_cancel(self, *args):
         """User confirmed cancel — stop download and clean up."""
-        popup.dismiss()
-        print("[Control] Download CANCELLED by user")
+        self._cancel_popup.dismiss()
+        log.info("[Control] Download CANCELLED by user")
         self._cancel_flag = True
         self._pause_event.set()
         self._reset_download_state()
         if self._notification_helper:
             self._notification_helper.stop_foreground_service()
-        Clock.schedule_once(lambda dt: self._cleanup_part_files(), 1.5)
+        # Scan + unlinks run on a worker so the UI never waits on the disk
+        Clock.schedule_once(
+            lambda dt: self._download_executor.submit(self._cleanup_part_files), 1.5
+        )
 
     def _handle_pause_action(self):
         """Handle pause/resume from notification action button"""
         if not self.is_loading:
             return
-        print("[Control] Pause/Resume triggered from notification")
-        self.on_pause_click()
+        log.info("[Control] Pause/Resume triggered from notification")
+        self.on_pause_resume_click()
 
     def _handle_cancel_action(self):
         """Handle cancel from notification action button"""
         if not self.is_loading:
             return
-        print("[Control] Cancel triggered from notification")
+        log.info("[Control] Cancel triggered from notification")
         self._cancel_flag = True
         self._pause_event.set()
         self._reset_download_state()
         if self._notification_helper:
             self._notification_helper.stop_foreground_service()
-        Clock.schedule_once(lambda dt: self._cleanup_part_files(), 1.5)
+        # Scan + unlinks run on a worker so the UI never waits on the disk
+        Clock.schedule_once(
+            lambda dt: self._download_executor.submit(self._cleanup_part_files), 1.5
+        )
 
     def _cleanup_part_files(self):
-        """Delete any .part or .ytdl files left by the cancelled download."""
+        """
+        Delete any .part or .ytdl files left by the cancelled download.
+        Runs on a download executor thread, not the Kivy thread.
+        """
         if not self._current_output_path:
             return
         try:
-            patterns = [
-                os.path.join(self._current_output_path, '*.part'),
-                os.path.join(self._current_output_path, '*.ytdl'),
-                os.path.join(self._current_output_path, '*.part-Frag*'),
-            ]
-            deleted = []
-            for pattern in patterns:
-                for f in glob.glob(pattern):
-                    try:
-                        os.remove(f)
-                        deleted.append(os.path.basename(f))
-                        print(f"[Cleanup] Deleted: {f}")
-                    except Exception as del_err:
-                        print(f"[Cleanup] Could not delete {f}: {del_err}")
-
-            if deleted:
-                print(f"[Cleanup] Removed {len(deleted)} temp file(s)")
-            else:
-                print("[Cleanup] No .part files found")
+            paths = []
+            # One directory pass; DirEntry.is_file() reuses the stat data the
+            # enumeration already fetched, so no extra syscall per entry.
+            with os.scandir(self._current_output_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if not (name.endswith(('.part', '.ytdl')) or '.part-Frag' in name):
+                        continue
+                    if entry.is_file(follow_symlinks=False):
+                        paths.append(entry.path)
+                    else:
+                        # unlink() would raise on a directory (or follow a link)
+                        _log(f"[Cleanup] Skipping non-file: {entry.path}")
+
+            if not paths:
+                _log("[Cleanup] No .part files found")
+                return
+
+            deleted = 0
+            for path in paths:
+                try:
+                    os.unlink(path)
+                    deleted += 1
+                    _log(f"[Cleanup] Deleted: {path}")
+                except FileNotFoundError:
+                    pass
+                except Exception as del_err:
+                    _log(f"[Cleanup] Could not delete {path}: {del_err}")
+            _log(f"[Cleanup] Removed {deleted} temp file(s)")
 
         except Exception as e:
-            print(f"[Cleanup] Error: {e}")
+            _log(f"[Cleanup] Error: {e}")
 
     def _reset_download_state(self):
         """Reset all download-related UI properties."""
@@ -1105,25 +1625,32 @@ class YouTubeDownloader(BoxLayout):
         self._postprocessing = False
         try:
             self.url_text = ''
-            self.ids.url_input.text = ''
-            print("[Control] URL input cleared after cancel")
+            self._url_input.text = ''
+            _log("[Control] URL input cleared after cancel")
         except Exception as e:
-            print(f"[Control] Could not clear URL field: {e}")
+            _log(f"[Control] Could not clear URL field: {e}")
 
     # ── Download logic ─────────────────────────────────────────────────────────
 
-    def start_download(self):
-        """Validate input and kick off download thread"""
+    def start_download(self, *args):
+        """Validate input and schedule the download task on the asyncio loop"""
         self.error_message = ''
         self.success_message = ''
 
-        if not self.validate_url(self.url_text):
+        urls = self.split_urls(self.url_text)
+        if not urls or not all(self.validate_url(u) for u in urls):
             self.error_message = 'Please enter a valid YouTube URL'
             return
 
         self._cancel_flag = False
+        self._batch_abort = False
         self._pause_event.set()
         self._last_total = 0
+        self._pending_progress = None
+        self._last_filename = None
+        # The worker uses this snapshot, not url_text, so edits made to the
+        # field mid-download can't change what it fetches
+        self._download_urls = urls
 
         self.is_loading = True
         self.is_paused = False
@@ -1131,26 +1658,61 @@ class YouTubeDownloader(BoxLayout):
         self.download_size = ''
         self.total_items = 0
 
-        self._download_thread = threading.Thread(target=self.download_video, daemon=True)
-        self._download_thread.start()
+        self._download_task = asyncio.ensure_future(self._download_async())
+
+    async def _download_async(self):
+        """
+        Runs on the Kivy/asyncio main loop. yt-dlp is fully blocking, so the
+        actual work is awaited through the loop's executor — the UI keeps
+        drawing while the worker thread downloads.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._download_executor, self.download_video)
+
+    def _check_pause_or_cancel(self):
+        """
+        Called from the progress hook on every tick. Blocks on _pause_event
+        while paused rather than polling it — every cancel path sets the
+        event after raising _cancel_flag, so a cancelled wait wakes at once.
+        """
+        if not self._pause_event.is_set():
+            self._pause_event.wait()
+        if self._cancel_flag:
+            if self._notification_helper:
+                self._notification_helper.cancel_notification()
+            raise get_yt_dlp().utils.DownloadCancelled("User cancelled")
+        if self._batch_abort:
+            raise get_yt_dlp().utils.DownloadCancelled("Batch aborted")
 
     def download_video(self):
         """
-        Core download worker — runs on background thread.
+        Core download worker — runs on an executor thread.
         Checks _cancel_flag and _pause_event on every progress tick.
         """
+        # Bound before the main try — its except clauses need yt_dlp.utils.
+        # Nothing awaits _download_task's result, so an import failure must
+        # be reported here or is_loading would stay True with no message.
+        try:
+            yt_dlp = get_yt_dlp()
+        except Exception as e:
+            log.exception("[yt-dlp] Import failed: %s", e)
+            Clock.schedule_once(
+                partial(self.on_download_error, f'yt-dlp unavailable: {str(e)[:60]}'), 0
+            )
+            return
         try:
+            urls = self._download_urls
             output_path = self.audio_path if self.audio_only else self.video_path
             self._current_output_path = output_path
 
-            print("\n" + "=" * 60)
-            print("DOWNLOAD STARTED")
-            print("=" * 60)
-            print(f"URL:      {self.url_text}")
-            print(f"Mode:     {'Audio (M4A/MP3)' if self.audio_only else 'Video'}")
-            print(f"Quality:  {self.quality_selected}")
-            print(f"Output:   {output_path}")
-            print(f"Platform: {'Android' if ANDROID else 'Desktop'}")
+            _log("\n" + "=" * 60)
+            _log("DOWNLOAD STARTED")
+            _log("=" * 60)
+            _log(f"URL:      {' '.join(urls)}")
+            _log(f"Mode:     {'Audio (M4A/MP3)' if self.audio_only else 'Video'}")
+            _log(f"Quality:  {self.quality_selected}")
+            _log(f"Output:   {output_path}")
+            _log(f"Platform: {'Android' if ANDROID else 'Desktop'}")
 
             if self._notification_helper:
                 mode = "Audio" if self.audio_only else "Video"
@@ -1159,41 +1721,47 @@ class YouTubeDownloader(BoxLayout):
                     f"Starting {mode} download..."
                 )
 
-            def progress_hook(d):
-                if self._cancel_flag:
-                    if self._notification_helper:
-                        self._notification_helper.cancel_notification()
-                    raise yt_dlp.utils.DownloadCancelled("User cancelled")
+            # Resolved once here so the hook's per-tick lookups are closure
+            # loads rather than attribute/global dict lookups
+            check_pause_or_cancel = self._check_pause_or_cancel
+            post_progress = self._post_progress
+            monotonic_ns = time.monotonic_ns
+            basename = os.path.basename
+            notifier = self._notification_helper
+            cancelled_exc = yt_dlp.utils.DownloadCancelled
 
-                while not self._pause_event.is_set():
-                    if self._cancel_flag:
-                        if self._notification_helper:
-                            self._notification_helper.cancel_notification()
-                        raise yt_dlp.utils.DownloadCancelled("User cancelled while paused")
-                    self._pause_event.wait(timeout=0.2)
+            def progress_hook(d):
+                check_pause_or_cancel()
 
                 try:
                     if d['status'] == 'downloading':
+                        # yt-dlp ticks per network chunk (often 100+ Hz); skip
+                        # the size formatting and notification work in between
+                        now = monotonic_ns()
+                        if now - self._last_progress_emit_ns < _PROGRESS_THROTTLE_NS:
+                            return
+                        self._last_progress_emit_ns = now
+
                         downloaded = d.get('downloaded_bytes', 0)
                         total = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
                         speed = d.get('speed', 0)
                         filename = d.get('filename', '')
                         
+                        percent = None
                         if total:
                             self._last_total = total
                             percent = (downloaded / total) * 100
-                            Clock.schedule_once(
-                                lambda dt: setattr(self, 'download_progress', percent), 0
-                            )
-                            if self._notification_helper:
-                                self._notification_helper.update_notification(
+                            if notifier:
+                                notifier.update_notification(
                                     filename, downloaded, total, speed, percent
                                 )
-                        elif self._notification_helper and downloaded > 0:
-                            self._notification_helper.update_notification(
+                        elif notifier and downloaded > 0:
+                            notifier.update_notification(
                                 filename, downloaded, 0, speed, -1
                             )
 
+                        # Formatted every emitted tick (the gate above caps it
+                        # at 20 Hz); _flush_progress skips unchanged labels
                         if total:
                             size_str = f'{format_size(downloaded)} / {format_size(total)}'
                         elif downloaded:
@@ -1201,135 +1769,124 @@ class YouTubeDownloader(BoxLayout):
                         else:
                             size_str = ''
 
-                        if size_str:
-                            Clock.schedule_once(
-                                lambda dt, s=size_str: setattr(self, 'download_size', s), 0
-                            )
-
-                        filename = d.get('filename', '')
-                        if filename:
-                            short_name = os.path.basename(filename)[:35]
-                            Clock.schedule_once(
-                                lambda dt, n=short_name: setattr(self, 'current_item', n), 0
-                            )
+                        short_name = None     # None → current_item unchanged
+                        if filename and filename != self._last_filename:
+                            self._last_filename = filename
+                            short_name = basename(filename)[:35]
+                        post_progress(percent, size_str or None, short_name)
                     elif d['status'] == 'finished':
-                        Clock.schedule_once(
-                            lambda dt: setattr(self, 'download_progress', 100), 0
-                        )
-                        print(f"[Progress] Download finished: {d.get('filename', 'unknown')}")
-                        if self._notification_helper:
+                        post_progress(100, None, None)
+                        _log(f"[Progress] Download finished: {d.get('filename', 'unknown')}")
+                        if notifier:
                             filename = d.get('filename', '')
                             total = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
-                            print(f"[Notification] Finished - filename: {filename}, total: {total}, postprocessing: {self._postprocessing}")
+                            _log(f"[Notification] Finished - filename: {filename}, total: {total}, postprocessing: {self._postprocessing}")
                             if self._postprocessing:
-                                short_name = os.path.basename(filename) if filename else 'Video'
+                                short_name = basename(filename) if filename else 'Video'
                                 if len(short_name) > 25:
                                     short_name = short_name[:22] + '...'
-                                self._notification_helper.update_notification(
+                                notifier.update_notification(
                                     f"{short_name} (Merging...)", 
                                     total if total else 0, total if total else 0, 0, 100
                                 )
                             else:
-                                self._notification_helper.update_notification(
-                                    f"{os.path.basename(filename) if filename else 'Downloaded'} ✓",
+                                notifier.update_notification(
+                                    f"{basename(filename) if filename else 'Downloaded'} ✓",
                                     total if total else 0, total if total else 0, 0, 100
                                 )
                     elif d['status'] == 'processing':
-                        if self._notification_helper:
+                        if notifier:
                             filename = d.get('filename', '')
-                            self._notification_helper.update_notification(
+                            notifier.update_notification(
                                 filename if filename else "Processing...", 
                                 0, 0, 0, -1
                             )
-                except yt_dlp.utils.DownloadCancelled:
+                except cancelled_exc:
                     raise
                 except Exception as hook_err:
-                    print(f"[Progress hook] Error: {hook_err}")
-
-            ydl_opts = {
-                'outtmpl': os.path.join(output_path, '%(title)s.%(ext)s'),
-                'logger': YTDLPLogger(),
-                'progress_hooks': [progress_hook],
-                'quiet': False,
-                'no_warnings': False,
-                'noprogress': False,
-                'ignoreerrors': False,
-                'nocheckcertificate': True,
-                'continuedl': True,
-            }
-
-            if self.is_playlist(self.url_text):
+                    _log(f"[Progress hook] Error: {hook_err}")
+
+            ydl_opts = dict(
+                self._YDL_BASE_OPTS,
+                outtmpl=os.path.join(output_path, '%(title)s.%(ext)s'),
+                logger=_YTDLP_LOGGER,
+                progress_hooks=[progress_hook],
+            )
+
+            has_playlist = any(self.is_playlist(u) for u in urls)
+            if has_playlist:
                 ydl_opts['noplaylist'] = False
-                print("Playlist detected — downloading all videos")
+                _log("Playlist detected — downloading all videos")
                 Clock.schedule_once(
                     lambda dt: setattr(self, 'success_message', 'Downloading playlist...'), 0
                 )
             else:
                 ydl_opts['noplaylist'] = True
-                print("Single video download")
+                _log("Single video download")
 
             if self.audio_only:
                 if ANDROID:
-                    ydl_opts['format'] = 'bestaudio[ext=m4a]/bestaudio'
-                    print("Android: Downloading M4A audio (no post-processing)")
+                    ydl_opts.update(self._YDL_AUDIO_M4A_OPTS)
+                    _log("Android: Downloading M4A audio (no post-processing)")
                 else:
                     ffmpeg = get_ffmpeg_bin()
-                    ydl_opts['format'] = 'bestaudio/best'
-                    ydl_opts['postprocessors'] = [{
-                        'key': 'FFmpegExtractAudio',
-                        'preferredcodec': 'mp3',
-                        'preferredquality': '192',
-                    }]
-                    ydl_opts['prefer_ffmpeg'] = True
+                    ydl_opts.update(self._YDL_AUDIO_MP3_OPTS)
                     ydl_opts['ffmpeg_location'] = ffmpeg
-                    print("Desktop: Converting audio to MP3 via ffmpeg")
+                    _log("Desktop: Converting audio to MP3 via ffmpeg")
             else:
-                quality_map = {
-                    'max':   ('best',               'bestvideo+bestaudio/best'),
-                    '1080p': ('best[height<=1080]',  'bestvideo[height<=1080]+bestaudio/best[height<=1080]'),
-                    '720':   ('best[height<=720]',   'bestvideo[height<=720]+bestaudio/best[height<=720]'),
-                    '480':   ('best[height<=480]',   'bestvideo[height<=480]+bestaudio/best[height<=480]'),
-                }
-                android_fmt, desktop_fmt = quality_map.get(
-                    self.quality_selected, quality_map['max']
+                android_fmt, desktop_fmt = self._QUALITY_MAP.get(
+                    self.quality_selected, self._QUALITY_MAP['max']
                 )
 
+                ydl_opts.update(self._YDL_VIDEO_OPTS)
+                ydl_opts['format'] = desktop_fmt
                 if ANDROID:
-                    ffmpeg = get_ffmpeg_bin()
-                    ydl_opts['format'] = desktop_fmt
-                    ydl_opts['ffmpeg_location'] = ffmpeg
-                    ydl_opts['merge_output_format'] = 'mp4'
-                    print(f"Android: Merging via ffmpeg_bin (format: {desktop_fmt})")
+                    ydl_opts['ffmpeg_location'] = get_ffmpeg_bin()
+                    _log(f"Android: Merging via ffmpeg_bin (format: {desktop_fmt})")
                 else:
-                    ydl_opts['format'] = desktop_fmt
-                    ydl_opts['merge_output_format'] = 'mp4'
-                    print(f"Desktop: Merging video+audio (format: {desktop_fmt})")
+                    _log(f"Desktop: Merging video+audio (format: {desktop_fmt})")
 
-            print("-" * 60)
-            print("Fetching video information...")
+            if self.audio_only and len(urls) == 1 and has_playlist:
+                # Audio entries are single HTTPS GETs — fetch them concurrently
+                urls = self._expand_playlist(yt_dlp, urls[0]) or urls
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(self.url_text, download=False)
+            if len(urls) > 1:
+                self._download_batch(urls, ydl_opts)
+            else:
+                _log("-" * 60)
+                _log("Fetching video information...")
+
+                # Flat probe: a playlist comes back as bare entry URLs from one
+                # page fetch instead of N full extractions; process_ie_result
+                # below resolves each entry as it reaches it
+                with yt_dlp.YoutubeDL(dict(ydl_opts, extract_flat='in_playlist')) as probe:
+                    info = probe.extract_info(urls[0], download=False)
 
                 if self._cancel_flag:
                     return
 
                 if info and 'entries' in info:
-                    total = len(list(info['entries']))
+                    # Count without draining entries — process_ie_result below
+                    # walks the same iterable, and a lazy one can't be rewound
+                    entries = info['entries']
+                    playlist_len = (
+                        info.get('playlist_count') or info.get('n_entries')
+                        or (len(entries) if isinstance(entries, (list, tuple)) else 0)
+                    )
                     Clock.schedule_once(
-                        lambda dt: setattr(self, 'total_items', total), 0
+                        lambda dt: setattr(self, 'total_items', playlist_len), 0
                     )
-                    print(f"Found {total} videos in playlist")
+                    _log(f"Found {playlist_len} videos in playlist")
                 else:
                     Clock.schedule_once(
                         lambda dt: setattr(self, 'total_items', 1), 0
                     )
                     title = info.get('title', 'Unknown') if info else 'Unknown'
-                    print(f"Video title: {title}")
+                    _log(f"Video title: {title}")
+
+                _log("-" * 60)
+                _log("Starting download...")
 
-                print("-" * 60)
-                print("Starting download...")
-                
                 if not self.audio_only and ANDROID:
                     self._postprocessing = True
                     if self._notification_helper:
@@ -1337,19 +1894,22 @@ class YouTubeDownloader(BoxLayout):
                         self._notification_helper.update_notification(
                             f"{filename} (Merging...)", 0, 0, 0, 100
                         )
-                
-                ydl.download([self.url_text])
-                
+
+                # Reuse the extracted info rather than ydl.download(), which
+                # would re-fetch the page, player JS and formats a 2nd time
+                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                    ydl.process_ie_result(info, download=True)
+
                 self._postprocessing = False
 
             if self._cancel_flag:
                 return
 
-            print("-" * 60)
-            print("Download completed successfully!")
-            print("=" * 60 + "\n")
+            _log("-" * 60)
+            _log("Download completed successfully!")
+            _log("=" * 60 + "\n")
 
-            print(f"[Notification] Download complete - showing completion notification (audio_only={self.audio_only})")
+            _log(f"[Notification] Download complete - showing completion notification (audio_only={self.audio_only})")
             if self._notification_helper:
                 self._notification_helper.stop_foreground_service()
                 folder = 'Audio' if self.audio_only else 'Video'
@@ -1361,76 +1921,245 @@ class YouTubeDownloader(BoxLayout):
                 )
             
             self._postprocessing = False
-            Clock.schedule_once(lambda dt: self.on_download_success(), 0)
+            Clock.schedule_once(self.on_download_success, 0)
 
         except yt_dlp.utils.DownloadCancelled:
-            print("[Control] Download thread exited after cancel")
+            _log("[Control] Download thread exited after cancel")
             self._postprocessing = False
 
         except RuntimeError as e:
             msg = str(e)
-            print(f"[FFmpeg] {msg}")
+            _log(f"[FFmpeg] {msg}")
             self._postprocessing = False
-            Clock.schedule_once(lambda dt: self.on_download_error(msg), 0)
+            Clock.schedule_once(partial(self.on_download_error, msg), 0)
 
         except yt_dlp.utils.DownloadError as e:
             error_msg = str(e)
-            print("\n" + "=" * 60)
-            print("DOWNLOAD ERROR (yt_dlp.DownloadError)")
-            print("=" * 60)
-            print(f"Full error: {error_msg}")
-            print("=" * 60 + "\n")
+            _log("\n" + "=" * 60)
+            _log("DOWNLOAD ERROR (yt_dlp.DownloadError)")
+            _log("=" * 60)
+            _log(f"Full error: {error_msg}")
+            _log("=" * 60 + "\n")
 
             if self._cancel_flag:
                 return
 
-            if 'Video unavailable' in error_msg:
-                user_msg = 'Video is unavailable or private'
-            elif 'No video formats' in error_msg:
-                user_msg = 'Selected quality not available for this video'
-            elif 'Sign in' in error_msg or 'login' in error_msg.lower():
-                user_msg = 'This video requires login — cannot download'
-            else:
-                user_msg = error_msg[:80] if len(error_msg) > 80 else error_msg
+            low = error_msg.lower()
+            user_msg = next(
+                (msg for needle, msg in _ERROR_MAP if needle in low), error_msg[:80]
+            )
 
             self._postprocessing = False
-            Clock.schedule_once(lambda dt: self.on_download_error(user_msg), 0)
+            Clock.schedule_once(partial(self.on_download_error, user_msg), 0)
 
         except Exception as e:
             import traceback
-            print("\n" + "=" * 60)
-            print("UNEXPECTED ERROR")
-            print("=" * 60)
-            print(f"Type:      {type(e).__name__}")
-            print(f"Message:   {e}")
-            print(f"Traceback:\n{traceback.format_exc()}")
-            print("=" * 60 + "\n")
+            _log("\n" + "=" * 60)
+            _log("UNEXPECTED ERROR")
+            _log("=" * 60)
+            _log(f"Type:      {type(e).__name__}")
+            _log(f"Message:   {e}")
+            _log(f"Traceback:\n{traceback.format_exc()}")
+            _log("=" * 60 + "\n")
 
             if self._cancel_flag:
                 return
 
             self._postprocessing = False
             user_msg = f'{type(e).__name__}: {str(e)[:60]}'
-            Clock.schedule_once(lambda dt: self.on_download_error(user_msg), 0)
+            Clock.schedule_once(partial(self.on_download_error, user_msg), 0)
+
+    def _expand_playlist(self, yt_dlp, url):
+        """
+        Resolve a playlist to its per-video URLs with a single flat page
+        fetch (no per-entry extraction). Returns [] if nothing was found.
+        """
+        _log("Resolving playlist entries...")
+        opts = {'extract_flat': 'in_playlist', 'logger': _YTDLP_LOGGER}
+        with yt_dlp.YoutubeDL(opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+        entries = (info or {}).get('entries') or []
+        entry_urls = [e.get('url') for e in entries if e and e.get('url')]
+        _log(f"Playlist resolved to {len(entry_urls)} entries")
+        return entry_urls
+
+    def _post_progress(self, progress, size, item):
+        """
+        Called from the download thread on every yt-dlp tick. Parks the
+        latest (progress, size, item) — None meaning "unchanged" — and
+        schedules at most one flush per 1/15 s on the Kivy thread, instead
+        of a Clock callback per property per tick.
+        """
+        pending = self._pending_progress
+        if pending is not None:
+            progress = pending[0] if progress is None else progress
+            size = pending[1] if size is None else size
+            item = pending[2] if item is None else item
+        self._pending_progress = (progress, size, item)
+        if not self._progress_flush_scheduled:
+            self._progress_flush_scheduled = True
+            Clock.schedule_once(self._flush_progress, 1 / 15.)
+
+    def _flush_progress(self, dt):
+        """Apply parked progress, writing only properties whose value changed."""
+        self._progress_flush_scheduled = False
+        pending, self._pending_progress = self._pending_progress, None
+        if pending is None or not self.is_loading:
+            return   # download finished or was reset meanwhile — drop stale values
+        progress, size, item = pending
+        if progress is not None and progress != self.download_progress:
+            self.download_progress = progress
+        if size is not None and size != self.download_size:
+            self.download_size = size
+        if item is not None and item != self.current_item:
+            self.current_item = item
+
+    def _download_batch(self, urls, ydl_opts):
+        """
+        Download several URLs concurrently, at most num_workers at a time.
+        YoutubeDL instances are not thread-safe, so each worker thread builds
+        one on first use and reuses it for every URL it picks up — extractor
+        and cookie-jar setup is paid once per worker, not once per URL.
+        The first error aborts the siblings at their next progress tick and
+        propagates to download_video's handlers.
+
+        Progress is tracked per download and reported as one aggregate: the
+        bar is (finished + fractions of running files) / count, the size
+        label counts finished items, and current_item and the notification
+        follow the oldest running download only — workers never overwrite
+        each other's file, size or _last_total.
+        """
+        yt_dlp = get_yt_dlp()
+        count = len(urls)
+        workers = max(1, int(self.num_workers))
+        if self._batch_executor is None or self._batch_workers != workers:
+            # num_workers changed since the pool was built — resize it
+            if self._batch_executor is not None:
+                self._batch_executor.shutdown(wait=False)
+            self._batch_executor = _DaemonPool(
+                max_workers=workers, thread_name_prefix='batch',
+            )
+            self._batch_workers = workers
+        self._batch_abort = False
+        _log(f"Batch of {count} URLs — up to {workers} concurrent workers")
+        Clock.schedule_once(lambda dt: setattr(self, 'total_items', count), 0)
+
+        # Fresh per batch — the pool threads outlive it, their YoutubeDLs must not
+        local = threading.local()
+        instances = []
+
+        # Worker thread id → fraction of the file it is downloading, in start
+        # order. Keys are only added/removed under the lock; the hook merely
+        # updates its own existing entry.
+        lock = threading.Lock()
+        running = {}
+        finished = 0
+        last_emit_ns = 0
+        check_pause_or_cancel = self._check_pause_or_cancel
+        post_progress = self._post_progress
+        notifier = self._notification_helper
+
+        def batch_hook(d):
+            nonlocal last_emit_ns
+            check_pause_or_cancel()
+            try:
+                if d['status'] != 'downloading':
+                    return
+                me = threading.get_ident()
+                downloaded = d.get('downloaded_bytes', 0)
+                total = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
+                if total:
+                    running[me] = min(downloaded / total, 1.0)
+
+                now = time.monotonic_ns()
+                if now - last_emit_ns < _PROGRESS_THROTTLE_NS:
+                    return
+                last_emit_ns = now
+                with lock:
+                    percent = (finished + sum(running.values())) / count * 100
+                    focused = next(iter(running), None) == me
+                    label = f'{finished} of {count} done'
+                if not focused:
+                    post_progress(percent, label, None)
+                    return
+
+                filename = d.get('filename', '')
+                name = os.path.basename(filename) if filename else None
+                post_progress(percent, label, name[:35] if name else None)
+                if notifier and name:
+                    notifier.update_notification(
+                        f"{finished + 1} of {count} • {name}", downloaded, total,
+                        d.get('speed', 0), downloaded / total * 100 if total else -1
+                    )
+            except Exception as hook_err:
+                _log(f"[Batch hook] Error: {hook_err}")
+
+        batch_opts = dict(ydl_opts, progress_hooks=[batch_hook])
+
+        def download_one(url):
+            nonlocal finished
+            if self._cancel_flag or self._batch_abort:
+                return
+            ydl = getattr(local, 'ydl', None)
+            if ydl is None:
+                ydl = local.ydl = yt_dlp.YoutubeDL(batch_opts)
+                instances.append(ydl)
+            me = threading.get_ident()
+            with lock:
+                running[me] = 0.0
+            ok = False
+            try:
+                ydl.download([url])
+                ok = True
+            finally:
+                with lock:
+                    del running[me]
+                    finished += ok
+
+        futures = [self._batch_executor.submit(download_one, url) for url in urls]
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                future.result()
+                _log(f"[Batch] {done}/{count} finished")
+                Clock.schedule_once(
+                    lambda dt, n=done: setattr(
+                        self, 'success_message', f'Downloaded {n} of {count}'
+                    ), 0
+                )
+        except BaseException:
+            # Stop the downloads already running too, not just queued ones,
+            # so the error reaches the UI without waiting for them to finish
+            self._batch_abort = True
+            self._pause_event.set()
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            # Let running downloads unwind before closing their YoutubeDLs
+            wait(futures)
+            for ydl in instances:
+                ydl.close()
 
     # ── Download result handlers ───────────────────────────────────────────────
 
-    def on_download_success(self):
+    def on_download_success(self, dt=0):
         """Called on main thread after successful download"""
+        # Cleared before success_message is set, so the input's on_text →
+        # on_url_change can't wipe the new message. on_text doesn't fire if
+        # the field is already empty, hence the explicit resets as well.
+        self._url_input.text = ''
+        self.url_text = ''
+        self.error_message = ''
         self.is_loading = False
         self.is_paused = False
-        self.error_message = ''
 
         file_type = 'Audio' if self.audio_only else 'Video'
         folder = 'Audio' if self.audio_only else 'Video'
         folder_path = self.audio_path if self.audio_only else self.video_path
 
-        print("\n" + "=" * 60)
-        print("DOWNLOAD COMPLETED SUCCESSFULLY!")
-        print("=" * 60)
-        print(f"Items:  {self.total_items}")
-        print(f"Saved:  {folder_path}")
-        print("=" * 60 + "\n")
+        rule = "=" * 60
+        log.info("\n%s\nDOWNLOAD COMPLETED SUCCESSFULLY!\n%s\nItems:  %s\nSaved:  %s\n%s\n",
+                 rule, rule, self.total_items, folder_path, rule)
 
         if self.total_items > 1:
             self.success_message = (
@@ -1442,15 +2171,13 @@ class YouTubeDownloader(BoxLayout):
             else:
                 self.success_message = f'✓ {file_type} downloaded to {folder} folder'
 
-        self.url_text = ''
-        self.ids.url_input.text = ''
         self.download_progress = 0
         self.download_size = ''
         self.current_item = ''
 
-        Clock.schedule_once(lambda dt: self.clear_success(), 7)
+        self._clear_success_trigger()
 
-    def on_download_error(self, error):
+    def on_download_error(self, error, dt=0):
         """Called on main thread when download fails"""
         self.is_loading = False
         self.is_paused = False
@@ -1458,11 +2185,11 @@ class YouTubeDownloader(BoxLayout):
         self.success_message = ''
         self.download_progress = 0
         self.download_size = ''
-        print(f"[Error displayed to user] {error}")
+        log.warning("[Error displayed to user] %s", error)
         if self._notification_helper:
             self._notification_helper.stop_foreground_service()
 
-    def clear_success(self):
+    def _clear_success(self, dt):
         """Clear success message"""
         self.success_message = ''
 
@@ -1473,6 +2200,8 @@ class YouTubeDownloaderApp(App):
 
     def build(self):
         self.title = 'YouTube Downloader'
+        # Once per app, not per widget — drains the deferred log queue
+        Clock.schedule_interval(_flush_log, 0.5)
         Builder.load_file('design.kv')
         self.root_widget = YouTubeDownloader()
 
@@ -1486,22 +2215,38 @@ class YouTubeDownloaderApp(App):
                 activity.bind(on_new_intent=self._on_new_intent_activity)
                 activity.bind(on_start=self._on_app_start)
                 activity.bind(on_stop=self._on_app_stop)
-                print("[App] on_new_intent bound to Android activity via activity.bind()")
+                log.info("[App] on_new_intent bound to Android activity via activity.bind()")
             except Exception as e:
-                print(f"[App] Could not bind on_new_intent via activity.bind(): {e}")
-                print("[App] Falling back — on_new_intent may not work when app is backgrounded")
+                log.warning("[App] Could not bind on_new_intent via activity.bind(): %s", e)
+                log.warning("[App] Falling back — on_new_intent may not work when app is backgrounded")
 
         return self.root_widget
 
+    def on_stop(self):
+        # Make any in-flight download bail out at its next progress tick and
+        # drop queued work. The workers are daemon threads (_DaemonPool), so
+        # interpreter exit doesn't wait on one stuck in a probe or merge.
+        if self.root_widget:
+            self.root_widget._cancel_flag = True
+            self.root_widget._pause_event.set()
+            self.root_widget._download_executor.shutdown(wait=False, cancel_futures=True)
+            if self.root_widget._batch_executor:
+                self.root_widget._batch_executor.shutdown(wait=False, cancel_futures=True)
+        _flush_log()
+
     def _on_app_start(self, *args):
         if self.root_widget:
             self.root_widget._app_in_foreground = True
-            print("[App] App in foreground")
+            if self.root_widget._notification_helper:
+                self.root_widget._notification_helper._app_in_foreground = True
+            log.info("[App] App in foreground")
 
     def _on_app_stop(self, *args):
         if self.root_widget:
             self.root_widget._app_in_foreground = False
-            print("[App] App in background")
+            if self.root_widget._notification_helper:
+                self.root_widget._notification_helper._app_in_foreground = False
+            log.info("[App] App in background")
 
     def _on_new_intent_activity(self, intent):
         """
@@ -1509,12 +2254,19 @@ class YouTubeDownloaderApp(App):
         to the already-running app (e.g. user shares a URL from YouTube
         while our app is in the background).
         """
-        print("[App] _on_new_intent_activity called — new intent received from Android")
+        log.info("[App] _on_new_intent_activity called — new intent received from Android")
         if hasattr(self, 'root_widget'):
             self.root_widget.on_new_intent(intent)
         else:
-            print("[App] _on_new_intent_activity: root_widget not ready — intent lost")
+            log.warning("[App] _on_new_intent_activity: root_widget not ready — intent lost")
+
+
+def run():
+    """Entry point — also used to launch the Cython-compiled build (setup.py)."""
+    # async_run() drives Kivy's event loop as an asyncio coroutine, so
+    # start_download() can schedule tasks on the same loop as the UI.
+    asyncio.run(YouTubeDownloaderApp().async_run(async_lib='asyncio'))
 
 
 if __name__ == '__main__':
-    YouTubeDownloaderApp().run()
\ No newline at end of file
+    run()
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""
+Optional desktop build — compiles main.py to a native extension with Cython.
+
+    pip install cython
+    python setup.py build_ext --inplace
+    python3 -c "import main; main.run()"
+
+The compiled module sits next to main.py and is picked up first by the
+import system. Android builds ignore this file — buildozer packages the
+plain main.py (see source.exclude_patterns in buildozer.spec).
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='ytdlapp',
+    ext_modules=cythonize(
+        'main.py',
+        language_level=3,
+        compiler_directives={'boundscheck': False, 'cdivision': True},
+    ),
+)